@@ -3,7 +3,9 @@ package cli
 import (
 	"context"
 	"fmt"
+	"os/signal"
 	"strings"
+	"syscall"
 	"time"
 
 	"github.com/spf13/cobra"
@@ -82,7 +84,12 @@ func runReview(_ *cobra.Command, _ []string) error {
 
 	runner := review.NewRunner(reviewConfig)
 
-	result, err := runner.RunIteration(context.Background(), wd, filesChanged)
+	// Review agents run in their own process group; forward terminal signals
+	// to them through context cancellation.
+	ctx, cancel := signal.NotifyContext(context.Background(), syscall.SIGINT, syscall.SIGTERM, syscall.SIGHUP)
+	defer cancel()
+
+	result, err := runner.RunIteration(ctx, wd, filesChanged)
 	if err != nil {
 		return fmt.Errorf("review failed: %w", err)
 	}
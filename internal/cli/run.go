@@ -7,8 +7,10 @@ import (
 	"io"
 	"os"
 	"os/exec"
+	"os/signal"
 	"strings"
 	"sync"
+	"syscall"
 
 	"github.com/spf13/cobra"
 
@@ -93,7 +95,7 @@ func runRun(_ *cobra.Command, args []string) error {
 	}
 
 	if runNonInteractive || (executorName != "" && executorName != "claude") {
-		return runClaudePrint(cfg, prompt, wd)
+		return runClaudePrint(context.Background(), cfg, prompt, wd)
 	}
 
 	return runClaudeDirect(prompt, wd)
@@ -108,7 +110,13 @@ func buildCommonFlags() []string {
 	return flags
 }
 
-func runClaudePrint(cfg *config.Config, prompt, workingDir string) error {
+// runClaudePrint runs the configured executor through its invoker. The
+// invoker starts the executor in its own process group, so terminal signals
+// are forwarded by canceling ctx rather than reaching the agent directly.
+func runClaudePrint(ctx context.Context, cfg *config.Config, prompt, workingDir string) error {
+	ctx, cancel := signal.NotifyContext(ctx, syscall.SIGINT, syscall.SIGTERM, syscall.SIGHUP)
+	defer cancel()
+
 	if runExecutor != "" {
 		cfg.Executor = runExecutor
 	}
@@ -127,7 +135,7 @@ func runClaudePrint(cfg *config.Config, prompt, workingDir string) error {
 		},
 	}
 
-	_, err = inv.Invoke(context.Background(), prompt, opts)
+	_, err = inv.Invoke(ctx, prompt, opts)
 	return err
 }
 
@@ -1,14 +1,18 @@
 package cli
 
 import (
+	"context"
 	"errors"
 	"io"
 	"os"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+
+	"github.com/alexander-akhmetov/programmator/internal/config"
 )
 
 func TestRunCmdDefinition(t *testing.T) {
@@ -135,6 +139,28 @@ func TestBuildCommonFlags(t *testing.T) {
 	assert.Equal(t, []string{"--max-turns", "10"}, flags)
 }
 
+// NOTE: Do not add t.Parallel() - this test mutates package-level variables.
+func TestRunClaudePrintCanceled(t *testing.T) {
+	origExecutor, origTurns := runExecutor, runMaxTurns
+	defer func() {
+		runExecutor, runMaxTurns = origExecutor, origTurns
+	}()
+	runExecutor, runMaxTurns = "", 0
+
+	tmpDir := t.TempDir()
+	script := "#!/bin/sh\ncat >/dev/null\nsleep 30\n"
+	require.NoError(t, os.WriteFile(tmpDir+"/claude", []byte(script), 0o755))
+	t.Setenv("PATH", tmpDir+":"+os.Getenv("PATH"))
+
+	ctx, cancel := context.WithCancel(context.Background())
+	time.AfterFunc(200*time.Millisecond, cancel)
+
+	start := time.Now()
+	err := runClaudePrint(ctx, &config.Config{}, "test", tmpDir)
+	assert.Error(t, err)
+	assert.Less(t, time.Since(start), 10*time.Second)
+}
+
 type errReader struct{}
 
 func (errReader) Read([]byte) (int, error) {
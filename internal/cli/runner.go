@@ -8,6 +8,7 @@ import (
 	"os/signal"
 	"sync"
 	"syscall"
+	"time"
 
 	"github.com/alexander-akhmetov/programmator/internal/domain"
 	"github.com/alexander-akhmetov/programmator/internal/event"
@@ -43,23 +44,25 @@ func Run(ctx context.Context, sourceID, workingDir string, cfg RunConfig) (*loop
 	w := NewWriter(out, cfg.IsTTY, cfg.TermWidth, cfg.TermHeight)
 	w.SetExecutorName(cfg.ExecutorConfig.Name)
 	w.SetClaudeConfigDir(cfg.ExecutorConfig.Claude.ClaudeConfigDir)
-	var footerMu sync.RWMutex
-	var latestState *safety.State
-	var latestItem *domain.WorkItem
+	var footerMu sync.Mutex
+	var lastSig footerSignature
+	haveSig := false
 
 	l := loop.New(
 		cfg.SafetyConfig,
 		workingDir,
 		func(state *safety.State, workItem *domain.WorkItem, _ []string) {
-			stateSnap := snapshotFooterState(state)
-			itemSnap := snapshotFooterWorkItem(workItem)
+			sig := newFooterSignature(state, workItem)
 
 			footerMu.Lock()
-			latestState = stateSnap
-			latestItem = itemSnap
+			if haveSig && sig == lastSig {
+				footerMu.Unlock()
+				return
+			}
+			lastSig, haveSig = sig, true
 			footerMu.Unlock()
 
-			w.UpdateFooter(stateSnap, itemSnap, cfg.SafetyConfig)
+			w.UpdateFooter(state, workItem, cfg.SafetyConfig)
 		},
 		true,
 	)
@@ -69,15 +72,7 @@ func Run(ctx context.Context, sourceID, workingDir string, cfg RunConfig) (*loop
 	})
 	l.SetProcessStatsCallback(func(pid int, memoryKB int64) {
 		w.SetProcessStats(pid, memoryKB)
-
-		footerMu.RLock()
-		stateSnap := latestState
-		itemSnap := latestItem
-		footerMu.RUnlock()
-
-		if stateSnap != nil || itemSnap != nil {
-			w.UpdateFooter(stateSnap, itemSnap, cfg.SafetyConfig)
-		}
+		w.RefreshFooter()
 	})
 
 	l.SetReviewConfig(cfg.ReviewConfig)
@@ -90,18 +85,20 @@ func Run(ctx context.Context, sourceID, workingDir string, cfg RunConfig) (*loop
 	l.SetGitWorkflowConfig(cfg.GitWorkflowConfig)
 	l.SetExecutorConfig(cfg.ExecutorConfig)
 
-	// Signal handling — stop loop on SIGINT/SIGTERM.
-	ctx, cancel := signal.NotifyContext(ctx, syscall.SIGINT, syscall.SIGTERM)
+	// Signal handling — stop loop on SIGINT/SIGTERM/SIGHUP. Executors run in
+	// their own process group, so terminal signals reach them only through
+	// this context's cancellation.
+	ctx, cancel := signal.NotifyContext(ctx, syscall.SIGINT, syscall.SIGTERM, syscall.SIGHUP)
 	defer cancel()
 
 	// Run loop synchronously in the main goroutine.
 	// The loop uses its own context internally, but we stop it on signal.
-	go func() {
-		<-ctx.Done()
-		l.Stop()
-	}()
+	// The stop hook is unregistered as soon as Run returns so a finished
+	// loop is never stopped after the fact.
+	stopOnSignal := context.AfterFunc(ctx, l.Stop)
 
 	result, err := l.Run(sourceID)
+	stopOnSignal()
 
 	// Always clean up the footer before returning.
 	w.ClearFooter()
@@ -147,37 +144,28 @@ func printRunSummary(w *Writer, result *loop.Result) {
 	)
 }
 
-// snapshotFooterState captures the state fields used in the footer to avoid
-// concurrent access while process-stats callbacks refresh every second.
-func snapshotFooterState(state *safety.State) *safety.State {
-	if state == nil {
-		return nil
-	}
-
-	setCopy := make(map[string]struct{}, len(state.TotalFilesChanged))
-	for k := range state.TotalFilesChanged {
-		setCopy[k] = struct{}{}
-	}
-
-	return &safety.State{
-		Iteration:            state.Iteration,
-		ConsecutiveNoChanges: state.ConsecutiveNoChanges,
-		TotalFilesChanged:    setCopy,
-		StartTime:            state.StartTime,
-	}
+// footerSignature holds the values the footer is rendered from. State
+// callbacks that leave it unchanged (e.g. token count updates within the
+// same second) skip the snapshot and redraw.
+type footerSignature struct {
+	hasState  bool
+	iteration int
+	elapsed   time.Duration // whole seconds; the footer shows no finer
+	itemID    string
+	stage     string
 }
 
-// snapshotFooterWorkItem captures footer-relevant work item fields.
-func snapshotFooterWorkItem(item *domain.WorkItem) *domain.WorkItem {
-	if item == nil {
-		return nil
+func newFooterSignature(state *safety.State, item *domain.WorkItem) footerSignature {
+	sig := footerSignature{stage: footerStageName(item)}
+	if state != nil {
+		sig.hasState = true
+		sig.iteration = state.Iteration
+		if !state.StartTime.IsZero() {
+			sig.elapsed = time.Since(state.StartTime).Truncate(time.Second)
+		}
 	}
-
-	phases := make([]domain.Phase, len(item.Phases))
-	copy(phases, item.Phases)
-
-	return &domain.WorkItem{
-		ID:     item.ID,
-		Phases: phases,
+	if item != nil {
+		sig.itemID = item.ID
 	}
+	return sig
 }
@@ -73,41 +73,33 @@ func TestRunConfig_Defaults(t *testing.T) {
 	assert.False(t, cfg.IsTTY)
 }
 
-func TestSnapshotFooterState(t *testing.T) {
-	original := &safety.State{
-		Iteration:            3,
-		ConsecutiveNoChanges: 1,
-		TotalFilesChanged: map[string]struct{}{
-			"a.go": {},
-		},
-		StartTime: time.Now().Add(-10 * time.Second),
-	}
-
-	snap := snapshotFooterState(original)
-	assert.NotNil(t, snap)
-	assert.Equal(t, original.Iteration, snap.Iteration)
-	assert.Equal(t, original.ConsecutiveNoChanges, snap.ConsecutiveNoChanges)
-	assert.Equal(t, original.StartTime, snap.StartTime)
-	assert.Len(t, snap.TotalFilesChanged, 1)
-
-	original.TotalFilesChanged["b.go"] = struct{}{}
-	assert.Len(t, snap.TotalFilesChanged, 1, "snapshot map must be independent from original")
-}
-
-func TestSnapshotFooterWorkItem(t *testing.T) {
-	original := &domain.WorkItem{
+func TestNewFooterSignature(t *testing.T) {
+	// Zero start time keeps elapsed out of the comparisons until tested.
+	state := &safety.State{Iteration: 1}
+	item := &domain.WorkItem{
 		ID: "i-123",
 		Phases: []domain.Phase{
-			{Name: "one", Completed: true},
+			{Name: "one", Completed: false},
 			{Name: "two", Completed: false},
 		},
 	}
 
-	snap := snapshotFooterWorkItem(original)
-	assert.NotNil(t, snap)
-	assert.Equal(t, "i-123", snap.ID)
-	assert.Equal(t, original.Phases, snap.Phases)
+	base := newFooterSignature(state, item)
+
+	state.SetCurrentIterTokens(100, 50)
+	state.Model = "opus"
+	assert.Equal(t, base, newFooterSignature(state, item), "token and model updates do not affect the footer")
+
+	state.Iteration = 2
+	assert.NotEqual(t, base, newFooterSignature(state, item))
+	state.Iteration = 1
+
+	item.Phases[0].Completed = true
+	assert.NotEqual(t, base, newFooterSignature(state, item))
+	item.Phases[0].Completed = false
+
+	state.StartTime = time.Now().Add(-5 * time.Second)
+	assert.NotEqual(t, base, newFooterSignature(state, item), "elapsed seconds are part of the signature")
 
-	original.Phases[0].Name = "changed"
-	assert.Equal(t, "one", snap.Phases[0].Name, "snapshot phases must be independent from original")
+	assert.NotEqual(t, newFooterSignature(nil, nil), newFooterSignature(&safety.State{}, nil))
 }
@@ -1,8 +1,10 @@
 package cli
 
 import (
+	"bytes"
 	"fmt"
 	"io"
+	"slices"
 	"strings"
 	"sync"
 	"time"
@@ -28,14 +30,34 @@ const (
 	colorPink    = 97  // Wisteria (#8e44ad)
 
 	footerIDPrefixChars = 12
+
+	// maxPendingLineBytes bounds the unterminated streaming line held back
+	// in Bubble Tea mode; longer lines are printed in pieces of this size.
+	maxPendingLineBytes = 16 * 1024
+)
+
+const (
+	progPrefix        = "programmator: "
+	progFailureMarker = "invocation failed:"
 )
 
+// Styled fragments of recurring event lines, built once rather than
+// formatted again for every event.
+var (
+	progPrefixStyled        = fgBold(colorOrange, progPrefix)
+	progFailurePrefixStyled = fgBold(colorRed, "X "+progPrefix)
+	iterationRuleStyled     = dim(strings.Repeat("─", 36))
+	iterationLabelStyled    = dim("Iteration ")
+)
+
+// bubbleFooterMsg carries the footer already joined into its final view,
+// so the model neither copies it on update nor rebuilds it on repaint.
 type bubbleFooterMsg struct {
-	lines []string
+	view string
 }
 
 type bubbleModel struct {
-	footer []string
+	footer string
 	ready  chan struct{}
 	once   sync.Once
 }
@@ -51,13 +73,97 @@ func (m *bubbleModel) Init() tea.Cmd {
 
 func (m *bubbleModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 	if msg, ok := msg.(bubbleFooterMsg); ok {
-		m.footer = append([]string(nil), msg.lines...)
+		m.footer = msg.view
 	}
 	return m, nil
 }
 
 func (m *bubbleModel) View() string {
-	return strings.Join(m.footer, "\n")
+	return m.footer
+}
+
+// teaOutbox delivers printed lines and footer updates to the Bubble Tea
+// program from its own goroutine. Every program send is a blocking
+// round-trip to the UI loop plus a repaint; queuing lets the event
+// producer return at once, and lines that arrive while a send is in
+// flight go out together in the next one. Only the latest footer is sent.
+type teaOutbox struct {
+	mu        sync.Mutex
+	lines     []string
+	footer    string
+	hasFooter bool
+
+	wake chan struct{}
+	stop chan struct{}
+	done chan struct{}
+}
+
+func startTeaOutbox(p *tea.Program) *teaOutbox {
+	o := &teaOutbox{
+		wake: make(chan struct{}, 1),
+		stop: make(chan struct{}),
+		done: make(chan struct{}),
+	}
+	go o.run(p)
+	return o
+}
+
+// println queues text to be printed above the footer.
+func (o *teaOutbox) println(text string) {
+	o.mu.Lock()
+	o.lines = append(o.lines, text)
+	o.mu.Unlock()
+	o.notify()
+}
+
+// setFooter queues a footer view, replacing one not yet sent.
+func (o *teaOutbox) setFooter(view string) {
+	o.mu.Lock()
+	o.footer, o.hasFooter = view, true
+	o.mu.Unlock()
+	o.notify()
+}
+
+func (o *teaOutbox) notify() {
+	select {
+	case o.wake <- struct{}{}:
+	default:
+	}
+}
+
+func (o *teaOutbox) run(p *tea.Program) {
+	defer close(o.done)
+	for {
+		select {
+		case <-o.wake:
+			o.flush(p)
+		case <-o.stop:
+			o.flush(p)
+			return
+		}
+	}
+}
+
+func (o *teaOutbox) flush(p *tea.Program) {
+	o.mu.Lock()
+	lines := o.lines
+	footer, hasFooter := o.footer, o.hasFooter
+	o.lines, o.footer, o.hasFooter = nil, "", false
+	o.mu.Unlock()
+
+	if len(lines) > 0 {
+		// Send, unlike Program.Println, returns once the program has exited.
+		p.Send(tea.Println(strings.Join(lines, "\n"))())
+	}
+	if hasFooter {
+		p.Send(bubbleFooterMsg{view: footer})
+	}
+}
+
+// close sends everything still queued and waits for the goroutine to exit.
+func (o *teaOutbox) close() {
+	close(o.stop)
+	<-o.done
 }
 
 // Writer prints events to stdout and redraws a sticky footer in TTY mode.
@@ -75,17 +181,45 @@ type Writer struct {
 	mu       sync.Mutex
 	renderer *glamour.TermRenderer
 
+	rendererInit bool // renderer is created lazily by markdownRenderer
+
 	footerLines int
 	lastFooter  []string
 	midLine     bool
 	pendingLine string
 
-	pid             int
-	executorName    string
-	claudeConfigDir string
+	// legacyFrame collects the footer erase, event text and footer redraw
+	// of one legacy TTY update so they reach the terminal in a single write.
+	legacyFrame bytes.Buffer
+
+	pid            int
+	executorName   string
+	pidLabel       string // "<executor> pid <n>", rebuilt when either changes
+	claudeDirLabel string // "claude_dir=<dir>", empty when unset
+
+	// Footer sections that only change with their inputs are rebuilt by
+	// UpdateFooter; a redraw only joins them with the elapsed time and pid.
+	// Of the last UpdateFooter inputs only these fixed fields are kept;
+	// the rest is folded into the labels, so no snapshot is retained.
+	hasFooterState bool
+	hasFooterItem  bool
+	footerStart    time.Time // state start time, zero when unknown
+	footerStale    bool      // an input or label changed since the last render
+
+	footerSep       string
+	footerPartSep   string
+	footerID        string
+	footerIDLabel   string
+	footerIter      [2]int // iteration and max iterations footerIterLabel shows
+	footerIterLabel string
+	footerStage     string
+	footerStageLine string
+	elapsedSecs     int    // whole seconds elapsedLabel was rendered for
+	elapsedLabel    string // styled " | <elapsed>" status-line suffix
 
 	useTea    bool
 	tea       *tea.Program
+	teaOut    *teaOutbox
 	teaDone   chan struct{}
 	teaActive bool
 }
@@ -104,17 +238,28 @@ func NewWriter(out io.Writer, isTTY bool, width, height int) *Writer {
 		useTea: isTTY,
 	}
 
-	if isTTY {
+	return w
+}
+
+// markdownRenderer returns the glamour renderer, creating it on first use.
+// Building it loads style definitions, and most runs never print markdown.
+// Must be called with mu held.
+func (w *Writer) markdownRenderer() *glamour.TermRenderer {
+	if w.rendererInit {
+		return w.renderer
+	}
+	w.rendererInit = true
+
+	if w.isTTY {
 		r, err := glamour.NewTermRenderer(
 			glamour.WithStandardStyle("dark"),
-			glamour.WithWordWrap(max(width-6, 40)),
+			glamour.WithWordWrap(max(w.width-6, 40)),
 		)
 		if err == nil {
 			w.renderer = r
 		}
 	}
-
-	return w
+	return w.renderer
 }
 
 func (w *Writer) colorEnabled() bool {
@@ -132,7 +277,7 @@ func (w *Writer) ensureTeaLocked() {
 		model,
 		tea.WithInput(nil),
 		tea.WithOutput(w.out),
-		// Let programmator's signal.NotifyContext own SIGINT/SIGTERM handling.
+		// Let programmator's signal.NotifyContext own SIGINT/SIGTERM/SIGHUP handling.
 		tea.WithoutSignalHandler(),
 	)
 	done := make(chan struct{})
@@ -145,6 +290,7 @@ func (w *Writer) ensureTeaLocked() {
 	select {
 	case <-ready:
 		w.tea = p
+		w.teaOut = startTeaOutbox(p)
 		w.teaDone = done
 		w.teaActive = true
 	case <-done:
@@ -175,8 +321,7 @@ func (w *Writer) WriteEvent(ev event.Event) {
 
 		w.flushTeaPendingLocked()
 
-		line := w.formatEventLine(ev)
-		w.tea.Println(line)
+		w.teaOut.println(w.formatEventLine(ev))
 		return
 	}
 
@@ -195,18 +340,20 @@ func (w *Writer) WriteEvent(ev event.Event) {
 		return
 	}
 
+	defer w.legacyFlush()
 	w.legacyEraseFooter()
 	if ev.Kind == event.KindStreamingText {
-		fmt.Fprint(w.out, ev.Text)
+		w.legacyFrame.WriteString(ev.Text)
 		w.midLine = !strings.HasSuffix(ev.Text, "\n")
 		w.legacyRedrawFooter()
 		return
 	}
 	if w.midLine {
-		fmt.Fprintln(w.out)
+		w.legacyFrame.WriteByte('\n')
 		w.midLine = false
 	}
-	fmt.Fprintln(w.out, w.formatEventLine(ev))
+	w.legacyFrame.WriteString(w.formatEventLine(ev))
+	w.legacyFrame.WriteByte('\n')
 	w.legacyRedrawFooter()
 }
 
@@ -240,6 +387,8 @@ func (w *Writer) formatEventLine(ev event.Event) string {
 }
 
 // UpdateFooter redraws the sticky footer with current state.
+// The Writer copies what it draws for later RefreshFooter calls and does
+// not retain state or item.
 func (w *Writer) UpdateFooter(state *safety.State, item *domain.WorkItem, cfg safety.Config) {
 	if !w.isTTY {
 		return
@@ -248,7 +397,81 @@ func (w *Writer) UpdateFooter(state *safety.State, item *domain.WorkItem, cfg sa
 	w.mu.Lock()
 	defer w.mu.Unlock()
 
-	lines := w.buildFooter(state, item, cfg)
+	w.setFooterInputsLocked(state, item, cfg)
+	w.renderFooterLocked()
+}
+
+// setFooterInputsLocked records what the footer needs from its inputs and
+// rebuilds the labels derived from them that changed. Must be called with mu held.
+func (w *Writer) setFooterInputsLocked(state *safety.State, item *domain.WorkItem, cfg safety.Config) {
+	w.hasFooterState = state != nil
+	w.hasFooterItem = item != nil
+	w.footerStart = time.Time{}
+	if state != nil {
+		w.footerStart = state.StartTime
+	}
+	w.footerStale = true
+
+	if item != nil && (item.ID != w.footerID || w.footerIDLabel == "") {
+		w.footerID = item.ID
+		w.footerIDLabel = sanitizeTerminalText(truncateRunes(item.ID, footerIDPrefixChars))
+	}
+
+	if state != nil {
+		iter := [2]int{state.Iteration, cfg.MaxIterations}
+		if iter != w.footerIter || w.footerIterLabel == "" {
+			w.footerIter = iter
+			w.footerIterLabel = fmt.Sprintf("iteration %d of %d", iter[0], iter[1])
+		}
+	}
+
+	stageName := footerStageName(item)
+	if stageName != w.footerStage || (stageName != "" && w.footerStageLine == "") {
+		w.footerStage = stageName
+		w.footerStageLine = ""
+		if stageName != "" {
+			w.footerStageLine = w.style(colorDim, "Working on: ") +
+				w.style(colorDimmer, sanitizeTerminalText(stageName))
+		}
+	}
+}
+
+// RefreshFooter redraws the footer from the inputs of the last UpdateFooter
+// call. It is meant for periodic ticks (elapsed time, pid changes) where
+// the loop state itself has not changed.
+func (w *Writer) RefreshFooter() {
+	if !w.isTTY {
+		return
+	}
+
+	w.mu.Lock()
+	defer w.mu.Unlock()
+
+	if !w.hasFooterState && !w.hasFooterItem {
+		return
+	}
+	// Stats ticks usually arrive with nothing new to show: same pid and
+	// an elapsed time still within the second already on screen.
+	if !w.footerStale && !w.elapsedChangedLocked() {
+		return
+	}
+	w.renderFooterLocked()
+}
+
+// elapsedChangedLocked reports whether the footer's elapsed time has moved
+// to a new second since it was last rendered. Must be called with mu held.
+func (w *Writer) elapsedChangedLocked() bool {
+	if w.footerStart.IsZero() {
+		return false
+	}
+	return int(time.Since(w.footerStart).Seconds()) != w.elapsedSecs
+}
+
+// renderFooterLocked builds the footer from the stored inputs and draws it
+// if it changed. Must be called with mu held.
+func (w *Writer) renderFooterLocked() {
+	w.footerStale = false
+	lines := w.buildFooter()
 	if w.height > 0 {
 		maxFooterLines := max(w.height-1, 0)
 		if maxFooterLines <= 0 {
@@ -259,19 +482,24 @@ func (w *Writer) UpdateFooter(state *safety.State, item *domain.WorkItem, cfg sa
 		}
 	}
 
+	// Most updates (e.g. the per-second stats tick) leave the rendered
+	// footer unchanged; skip the redraw when it is already on screen.
+	if len(lines) > 0 && slices.Equal(lines, w.lastFooter) {
+		return
+	}
+
 	w.lastFooter = lines
 	w.footerLines = len(lines)
 
 	w.ensureTeaLocked()
 	if w.teaActive {
-		w.tea.Send(bubbleFooterMsg{lines: lines})
+		w.teaOut.setFooter(strings.Join(lines, "\n"))
 		return
 	}
 
 	w.legacyEraseFooter()
-	for _, line := range lines {
-		fmt.Fprintln(w.out, line)
-	}
+	w.legacyRedrawFooter()
+	w.legacyFlush()
 }
 
 // ClearFooter clears the footer overlay.
@@ -285,14 +513,18 @@ func (w *Writer) ClearFooter() {
 
 	if w.teaActive {
 		w.flushTeaPendingLocked()
-		w.tea.Send(bubbleFooterMsg{lines: nil})
+		w.teaOut.setFooter("")
+		w.teaOut.close()
 		w.tea.Quit()
 		done := w.teaDone
 		w.teaActive = false
 		w.tea = nil
+		w.teaOut = nil
 		w.teaDone = nil
 		w.footerLines = 0
 		w.lastFooter = nil
+		w.hasFooterState = false
+		w.hasFooterItem = false
 		w.midLine = false
 		w.pendingLine = ""
 		if done != nil {
@@ -307,11 +539,14 @@ func (w *Writer) ClearFooter() {
 	w.legacyEraseFooter()
 	w.footerLines = 0
 	w.lastFooter = nil
+	w.hasFooterState = false
+	w.hasFooterItem = false
 
 	if w.midLine {
-		fmt.Fprintln(w.out)
+		w.legacyFrame.WriteByte('\n')
 		w.midLine = false
 	}
+	w.legacyFlush()
 }
 
 func (w *Writer) writeTeaStreamingLocked(text string) {
@@ -320,18 +555,20 @@ func (w *Writer) writeTeaStreamingLocked(text string) {
 	}
 
 	combined := w.pendingLine + text
-	parts := strings.Split(combined, "\n")
-	if len(parts) == 1 {
+	nl := strings.LastIndexByte(combined, '\n')
+	if nl < 0 {
 		w.pendingLine = combined
 		w.midLine = true
+		if len(w.pendingLine) >= maxPendingLineBytes {
+			w.flushTeaPendingLocked()
+		}
 		return
 	}
 
-	for _, line := range parts[:len(parts)-1] {
-		w.tea.Println(line)
-	}
+	// Hand all complete lines over as one message rather than one per line.
+	w.teaOut.println(combined[:nl])
 
-	w.pendingLine = parts[len(parts)-1]
+	w.pendingLine = combined[nl+1:]
 	w.midLine = w.pendingLine != ""
 }
 
@@ -340,7 +577,7 @@ func (w *Writer) flushTeaPendingLocked() {
 		w.midLine = false
 		return
 	}
-	w.tea.Println(w.pendingLine)
+	w.teaOut.println(w.pendingLine)
 	w.pendingLine = ""
 	w.midLine = false
 }
@@ -354,6 +591,7 @@ func (w *Writer) SetExecutorName(name string) {
 		name = "claude"
 	}
 	w.executorName = sanitizeTerminalText(strings.ToLower(name))
+	w.updatePIDLabelLocked()
 }
 
 // SetClaudeConfigDir sets a non-default Claude config directory to display in the footer.
@@ -361,7 +599,11 @@ func (w *Writer) SetClaudeConfigDir(dir string) {
 	w.mu.Lock()
 	defer w.mu.Unlock()
 
-	w.claudeConfigDir = dir
+	w.footerStale = true
+	w.claudeDirLabel = ""
+	if dir != "" {
+		w.claudeDirLabel = "claude_dir=" + sanitizeTerminalText(dir)
+	}
 }
 
 // SetProcessStats updates the PID field used by the footer.
@@ -369,97 +611,129 @@ func (w *Writer) SetProcessStats(pid int, memKB int64) {
 	w.mu.Lock()
 	defer w.mu.Unlock()
 
-	w.pid = pid
+	if pid != w.pid {
+		w.pid = pid
+		w.updatePIDLabelLocked()
+	}
 	_ = memKB
 }
 
-// legacyEraseFooter moves cursor up and clears footer lines. Must be called with mu held.
+// updatePIDLabelLocked rebuilds pidLabel. Must be called with mu held.
+func (w *Writer) updatePIDLabelLocked() {
+	w.footerStale = true
+	if w.pid <= 0 {
+		w.pidLabel = ""
+		return
+	}
+	name := w.executorName
+	if name == "" {
+		name = "claude"
+	}
+	w.pidLabel = fmt.Sprintf("%s pid %d", name, w.pid)
+}
+
+// legacyEraseFooter queues cursor-up and clear-line sequences for the footer
+// lines. Must be called with mu held.
 func (w *Writer) legacyEraseFooter() {
 	if w.footerLines == 0 || !w.isTTY {
 		return
 	}
 	for range w.footerLines {
-		fmt.Fprint(w.out, "\033[A\033[2K")
+		w.legacyFrame.WriteString("\033[A\033[2K")
 	}
 }
 
-// legacyRedrawFooter redraws the last-known footer after an event line.
+// legacyRedrawFooter queues the last-known footer after an event line.
 // Must be called with mu held.
 func (w *Writer) legacyRedrawFooter() {
 	if len(w.lastFooter) == 0 || !w.isTTY {
 		return
 	}
 	for _, line := range w.lastFooter {
-		fmt.Fprintln(w.out, line)
+		w.legacyFrame.WriteString(line)
+		w.legacyFrame.WriteByte('\n')
 	}
 	w.footerLines = len(w.lastFooter)
 }
 
+// legacyFlush writes the queued frame to the output in one call.
+// Must be called with mu held.
+func (w *Writer) legacyFlush() {
+	if w.legacyFrame.Len() == 0 {
+		return
+	}
+	_, _ = w.out.Write(w.legacyFrame.Bytes())
+	w.legacyFrame.Reset()
+}
+
 // --- Footer content ---
 
-// buildFooter composes the footer lines.
-func (w *Writer) buildFooter(state *safety.State, item *domain.WorkItem, cfg safety.Config) []string {
-	var lines []string
+// elapsedLabelLocked returns the styled elapsed-time suffix of the status
+// line, reformatting it only when the whole-second value changes.
+// Must be called with mu held.
+func (w *Writer) elapsedLabelLocked(d time.Duration) string {
+	secs := int(d.Seconds())
+	if w.elapsedLabel == "" || secs != w.elapsedSecs {
+		w.elapsedSecs = secs
+		w.elapsedLabel = w.style(colorDim, " | ") + w.style(colorWhite, formatElapsed(d))
+	}
+	return w.elapsedLabel
+}
+
+// buildFooter composes the footer lines from the labels prepared by
+// setFooterInputsLocked. Must be called with mu held.
+func (w *Writer) buildFooter() []string {
+	lines := make([]string, 0, 3)
 
 	// Orange separator line.
-	sep := strings.Repeat("─", w.width)
-	lines = append(lines, w.style(colorOrange, sep))
-
-	stageName := ""
-	if item != nil {
-		if phase := item.CurrentPhase(); phase != nil {
-			stageName = phase.Name
-		} else if item.AllPhasesComplete() {
-			stageName = "complete"
-		}
+	if w.footerSep == "" {
+		w.footerSep = w.style(colorOrange, strings.Repeat("─", w.width))
+		w.footerPartSep = w.style(colorDim, " | ")
 	}
+	lines = append(lines, w.footerSep)
 
 	// Status line: [claude_dir] | item | iteration | elapsed | pid
-	var parts []string
-	if w.claudeConfigDir != "" {
-		parts = append(parts, w.style(colorDim, "claude_dir=")+w.style(colorDimmer, sanitizeTerminalText(w.claudeConfigDir)))
-	}
-	if item != nil {
-		parts = append(parts, w.styleBold(colorMagenta, sanitizeTerminalText(truncateRunes(item.ID, footerIDPrefixChars))))
-		if state != nil {
-			parts = append(parts, w.style(colorWhite, fmt.Sprintf("iteration %d of %d", state.Iteration, cfg.MaxIterations)))
-		}
-	} else if state != nil {
-		parts = append(parts, w.style(colorWhite, fmt.Sprintf("iteration %d of %d", state.Iteration, cfg.MaxIterations)))
+	// The labels are plain, already sanitized text; only the separators
+	// and the elapsed time are colored.
+	var partsBuf [4]string
+	parts := partsBuf[:0]
+	if w.claudeDirLabel != "" {
+		parts = append(parts, w.claudeDirLabel)
 	}
-	if w.pid > 0 {
-		name := w.executorName
-		if name == "" {
-			name = "claude"
-		}
-		parts = append(parts, w.style(colorDim, fmt.Sprintf("%s pid %d", name, w.pid)))
+	if w.hasFooterItem {
+		parts = append(parts, w.footerIDLabel)
+	}
+	if w.hasFooterState {
+		parts = append(parts, w.footerIterLabel)
+	}
+	if w.pidLabel != "" {
+		parts = append(parts, w.pidLabel)
 	}
 	if len(parts) > 0 {
-		parts = sanitizeSlice(parts)
-		statusLine := strings.Join(parts, w.style(colorDim, " | "))
-		if state != nil && !state.StartTime.IsZero() {
-			statusLine += w.style(colorDim, " | ") + w.style(colorWhite, formatElapsed(time.Since(state.StartTime)))
+		statusLine := strings.Join(parts, w.footerPartSep)
+		if !w.footerStart.IsZero() {
+			statusLine += w.elapsedLabelLocked(time.Since(w.footerStart))
 		}
 		lines = append(lines, statusLine)
 	}
 
 	// Current work line on its own row.
-	if stageName != "" {
-		lines = append(lines,
-			w.style(colorDim, "Working on: ")+
-				w.style(colorDimmer, sanitizeTerminalText(stageName)),
-		)
+	if w.footerStage != "" {
+		lines = append(lines, w.footerStageLine)
 	}
 
 	return lines
 }
 
-func sanitizeSlice(in []string) []string {
-	out := make([]string, 0, len(in))
-	for _, s := range in {
-		out = append(out, sanitizeTerminalText(s))
+// footerStageName returns what the footer's "Working on" line shows for item.
+func footerStageName(item *domain.WorkItem) string {
+	if item == nil || len(item.Phases) == 0 {
+		return ""
+	}
+	if i := item.CurrentPhaseIndex(); i >= 0 {
+		return item.Phases[i].Name
 	}
-	return out
+	return "complete"
 }
 
 func truncateRunes(s string, maxChars int) string {
@@ -479,18 +753,19 @@ func truncateRunes(s string, maxChars int) string {
 // Formatting methods per event kind.
 
 func (w *Writer) formatProg(text string) string {
-	prefix := "programmator: "
-	isFailure := strings.HasPrefix(strings.ToLower(strings.TrimSpace(text)), "invocation failed:")
+	trimmed := strings.TrimSpace(text)
+	isFailure := len(trimmed) >= len(progFailureMarker) &&
+		strings.EqualFold(trimmed[:len(progFailureMarker)], progFailureMarker)
 	if w.colorEnabled() {
 		if isFailure {
-			return fgBold(colorRed, "X "+prefix) + text
+			return progFailurePrefixStyled + text
 		}
-		return fgBold(colorOrange, prefix) + text
+		return progPrefixStyled + text
 	}
 	if isFailure {
-		return "X " + prefix + text
+		return "X " + progPrefix + text
 	}
-	return prefix + text
+	return progPrefix + text
 }
 
 func (w *Writer) formatTool(text string) string {
@@ -543,8 +818,8 @@ func (w *Writer) formatDiffHunk(text string) string {
 }
 
 func (w *Writer) formatMarkdown(text string) string {
-	if w.renderer != nil {
-		if rendered, err := w.renderer.Render(text); err == nil {
+	if r := w.markdownRenderer(); r != nil {
+		if rendered, err := r.Render(text); err == nil {
 			return strings.TrimRight(rendered, "\n")
 		}
 	}
@@ -562,9 +837,8 @@ func (w *Writer) formatIterSep(text string) string {
 }
 
 func (w *Writer) formatIterationHeader(iter, maxIter string) string {
-	line := strings.Repeat("─", 36)
 	if w.colorEnabled() {
-		return dim(line) + "\n  " + dim("Iteration ") + fgBold(colorWhite, iter) + dim("/"+maxIter)
+		return iterationRuleStyled + "\n  " + iterationLabelStyled + fgBold(colorWhite, iter) + dim("/"+maxIter)
 	}
 	return "── Iteration " + iter + "/" + maxIter + " ──"
 }
@@ -647,7 +921,9 @@ func (w *Writer) styleBold(color int, text string) string {
 // sanitizeTerminalText removes control sequences that can move the cursor or
 // otherwise disrupt sticky-footer rendering.
 func sanitizeTerminalText(text string) string {
-	if text == "" {
+	// Most event text is plain; return it as is when there is nothing to
+	// rewrite or drop, instead of copying it through every pass below.
+	if !hasControlBytes(text) {
 		return text
 	}
 
@@ -670,6 +946,17 @@ func sanitizeTerminalText(text string) string {
 	return b.String()
 }
 
+// hasControlBytes reports whether text contains a C0 control other than LF
+// (this includes CR, tab and the ESC that starts ANSI sequences).
+func hasControlBytes(text string) bool {
+	for i := range len(text) {
+		if text[i] < 0x20 && text[i] != '\n' {
+			return true
+		}
+	}
+	return false
+}
+
 // stripANSISequences removes common ANSI control sequences (CSI/OSC/ESC).
 func stripANSISequences(text string) string {
 	if !strings.ContainsRune(text, '\x1b') {
@@ -97,6 +97,19 @@ func TestWriteEvent(t *testing.T) {
 	}
 }
 
+func TestWriter_MarkdownRendererCreatedOnFirstUse(t *testing.T) {
+	var buf bytes.Buffer
+	w := NewWriter(&buf, true, 80, 0)
+	assert.Nil(t, w.renderer)
+
+	w.mu.Lock()
+	out := w.formatMarkdown("Some **bold** text")
+	w.mu.Unlock()
+
+	assert.NotNil(t, w.renderer)
+	assert.Contains(t, out, "bold")
+}
+
 func TestWriteEvent_DiffLines(t *testing.T) {
 	var buf bytes.Buffer
 	w := newTestWriter(&buf)
@@ -150,6 +163,45 @@ func TestWriteEvent_TTYMode(t *testing.T) {
 	}
 }
 
+// countingWriter records every Write call separately.
+type countingWriter struct {
+	writes []string
+}
+
+func (c *countingWriter) Write(p []byte) (int, error) {
+	c.writes = append(c.writes, string(p))
+	return len(p), nil
+}
+
+func TestWriteEvent_TTYModeWritesEachUpdateOnce(t *testing.T) {
+	out := &countingWriter{}
+	w := &Writer{out: out, isTTY: true, width: 80}
+
+	state := safety.NewState()
+	state.Iteration = 1
+	w.UpdateFooter(state, &domain.WorkItem{ID: "t-1", Phases: []domain.Phase{{Name: "Phase 1"}}}, safety.Config{MaxIterations: 5})
+	require.Len(t, out.writes, 1)
+	footerLines := w.footerLines
+	require.Greater(t, footerLines, 1)
+
+	out.writes = nil
+	w.WriteEvent(event.Prog("first"))
+	w.WriteEvent(event.StreamingText("partial"))
+	w.WriteEvent(event.Prog("second"))
+	require.Len(t, out.writes, 3)
+
+	frame := out.writes[2]
+	assert.Equal(t, footerLines, strings.Count(frame, "\033[A\033[2K"))
+	assert.True(t, strings.HasPrefix(frame, strings.Repeat("\033[A\033[2K", footerLines)+"\n"))
+	assert.Contains(t, frame, "second")
+	assert.Equal(t, footerLines+2, strings.Count(frame, "\n"))
+
+	out.writes = nil
+	w.ClearFooter()
+	require.Len(t, out.writes, 1)
+	assert.Equal(t, strings.Repeat("\033[A\033[2K", footerLines), out.writes[0])
+}
+
 func TestFormatProg_FailurePrefix(t *testing.T) {
 	var buf bytes.Buffer
 	wTTY := newTestWriterTTY(&buf)
@@ -162,6 +214,11 @@ func TestFormatProg_FailurePrefix(t *testing.T) {
 	plainLine := wNoTTY.formatProg("Invocation failed: claude exited: signal: interrupt")
 	assert.Contains(t, plainLine, "X programmator:")
 	assert.NotContains(t, plainLine, "\033[")
+
+	assert.Equal(t, "X programmator:   INVOCATION FAILED: x", wNoTTY.formatProg("  INVOCATION FAILED: x"))
+	assert.Equal(t, "programmator: invocation fail", wNoTTY.formatProg("invocation fail"))
+	assert.Equal(t, "programmator: Invocation succeeded", wNoTTY.formatProg("Invocation succeeded"))
+	assert.Equal(t, fgBold(colorOrange, "programmator: ")+"ok", wTTY.formatProg("ok"))
 }
 
 func TestUpdateFooter(t *testing.T) {
@@ -365,6 +422,164 @@ func TestUpdateFooter_PhaseOnSecondLineAndPIDOnFirst(t *testing.T) {
 	assert.Contains(t, w.lastFooter[2], fmt.Sprintf("\033[38;5;%dm", colorDimmer))
 }
 
+func TestUpdateFooter_StageLineFollowsPhaseChanges(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+
+	state := safety.NewState()
+	cfg := safety.Config{MaxIterations: 10, StagnationLimit: 3}
+	item := &domain.WorkItem{
+		ID: "stage-cache",
+		Phases: []domain.Phase{
+			{Name: "First", Completed: false},
+			{Name: "Second", Completed: false},
+		},
+	}
+
+	w.UpdateFooter(state, item, cfg)
+	require.Len(t, w.lastFooter, 3)
+	assert.Contains(t, stripANSISequences(w.lastFooter[2]), "Working on: First")
+
+	item.Phases[0].Completed = true
+	w.UpdateFooter(state, item, cfg)
+	require.Len(t, w.lastFooter, 3)
+	assert.Contains(t, stripANSISequences(w.lastFooter[2]), "Working on: Second")
+
+	item.Phases[1].Completed = true
+	w.UpdateFooter(state, item, cfg)
+	require.Len(t, w.lastFooter, 3)
+	assert.Contains(t, stripANSISequences(w.lastFooter[2]), "Working on: complete")
+}
+
+func TestUpdateFooter_TruncatedIDFollowsItemChanges(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+	cfg := safety.Config{MaxIterations: 10, StagnationLimit: 3}
+
+	w.UpdateFooter(nil, &domain.WorkItem{ID: "first-very-long-ticket-id"}, cfg)
+	require.GreaterOrEqual(t, len(w.lastFooter), 2)
+	assert.Contains(t, stripANSISequences(w.lastFooter[1]), "first-ver...")
+
+	w.UpdateFooter(nil, &domain.WorkItem{ID: "second"}, cfg)
+	require.GreaterOrEqual(t, len(w.lastFooter), 2)
+	status := stripANSISequences(w.lastFooter[1])
+	assert.Contains(t, status, "second")
+	assert.NotContains(t, status, "first")
+}
+
+func TestUpdateFooter_SkipsRedrawWhenUnchanged(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+
+	state := &safety.State{Iteration: 1}
+	item := &domain.WorkItem{ID: "same", Phases: []domain.Phase{{Name: "One"}}}
+	cfg := safety.Config{MaxIterations: 10, StagnationLimit: 3}
+
+	w.UpdateFooter(state, item, cfg)
+	require.NotZero(t, buf.Len())
+
+	buf.Reset()
+	w.UpdateFooter(state, item, cfg)
+	assert.Zero(t, buf.Len(), "unchanged footer must not be redrawn")
+
+	state.Iteration = 2
+	w.UpdateFooter(state, item, cfg)
+	assert.Contains(t, stripANSISequences(buf.String()), "iteration 2 of 10")
+}
+
+func TestUpdateFooter_IterationLabelFollowsStateChanges(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+	item := &domain.WorkItem{ID: "iter"}
+
+	w.UpdateFooter(&safety.State{Iteration: 1}, item, safety.Config{MaxIterations: 5})
+	require.GreaterOrEqual(t, len(w.lastFooter), 2)
+	assert.Contains(t, stripANSISequences(w.lastFooter[1]), "iteration 1 of 5")
+
+	w.UpdateFooter(&safety.State{Iteration: 2}, item, safety.Config{MaxIterations: 5})
+	assert.Contains(t, stripANSISequences(w.lastFooter[1]), "iteration 2 of 5")
+
+	w.UpdateFooter(&safety.State{Iteration: 2}, item, safety.Config{MaxIterations: 8})
+	assert.Contains(t, stripANSISequences(w.lastFooter[1]), "iteration 2 of 8")
+
+	w.UpdateFooter(nil, item, safety.Config{MaxIterations: 8})
+	assert.NotContains(t, stripANSISequences(w.lastFooter[1]), "iteration")
+}
+
+func TestUpdateFooter_DoesNotRetainInputs(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+
+	state := &safety.State{Iteration: 2}
+	item := &domain.WorkItem{ID: "kept", Phases: []domain.Phase{{Name: "Phase 1"}}}
+	w.UpdateFooter(state, item, safety.Config{MaxIterations: 10})
+
+	state.Iteration = 9
+	item.ID = "changed"
+	item.Phases[0].Name = "Mutated"
+	w.SetProcessStats(55, 0)
+	w.RefreshFooter()
+
+	footer := stripANSISequences(strings.Join(w.lastFooter, "\n"))
+	assert.Contains(t, footer, "kept | iteration 2 of 10 | claude pid 55")
+	assert.Contains(t, footer, "Working on: Phase 1")
+}
+
+func TestRefreshFooter_UsesLastFooterInputs(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+
+	w.RefreshFooter()
+	assert.Zero(t, buf.Len(), "nothing to refresh before the first UpdateFooter")
+
+	state := &safety.State{Iteration: 4}
+	w.UpdateFooter(state, &domain.WorkItem{ID: "refresh"}, safety.Config{MaxIterations: 10})
+
+	buf.Reset()
+	w.SetProcessStats(0, 0)
+	assert.False(t, w.footerStale, "unchanged pid must not mark the footer stale")
+	w.RefreshFooter()
+	assert.Zero(t, buf.Len())
+
+	w.SetProcessStats(4321, 0)
+	assert.True(t, w.footerStale)
+	w.RefreshFooter()
+	assert.False(t, w.footerStale)
+	assert.NotZero(t, buf.Len())
+	require.GreaterOrEqual(t, len(w.lastFooter), 2)
+	status := stripANSISequences(w.lastFooter[1])
+	assert.Contains(t, status, "iteration 4 of 10")
+	assert.Contains(t, status, "pid 4321")
+
+	w.ClearFooter()
+	buf.Reset()
+	w.RefreshFooter()
+	assert.Zero(t, buf.Len(), "cleared footer must not be redrawn")
+}
+
+func TestUpdateFooter_ClaudeDirAndExecutorLabels(t *testing.T) {
+	var buf bytes.Buffer
+	w := newTestWriterTTY(&buf)
+	cfg := safety.Config{MaxIterations: 10}
+	item := &domain.WorkItem{ID: "labels"}
+
+	w.SetClaudeConfigDir("/tmp/claude-alt")
+	w.SetProcessStats(77, 0)
+	w.UpdateFooter(nil, item, cfg)
+	require.GreaterOrEqual(t, len(w.lastFooter), 2)
+	status := stripANSISequences(w.lastFooter[1])
+	assert.Equal(t, "claude_dir=/tmp/claude-alt | labels | claude pid 77", status)
+	assert.True(t, strings.HasPrefix(w.lastFooter[1], "claude_dir=/tmp/claude-alt"+w.footerPartSep+"labels"),
+		"labels are plain text joined by the styled separator")
+
+	w.SetExecutorName("Codex")
+	w.SetClaudeConfigDir("")
+	w.RefreshFooter()
+	status = stripANSISequences(w.lastFooter[1])
+	assert.NotContains(t, status, "claude_dir=")
+	assert.Contains(t, status, "codex pid 77")
+}
+
 func TestWriter_ConcurrentWrites(t *testing.T) {
 	var buf bytes.Buffer
 	w := newTestWriter(&buf)
@@ -484,6 +699,12 @@ func TestWriteEvent_StreamingToStructuredTransition(t *testing.T) {
 func TestSanitizeTerminalText(t *testing.T) {
 	got := sanitizeTerminalText("a\r\nb\rc\x1b[31mred\x1b[0m\x00")
 	assert.Equal(t, "a\nb\ncred", got)
+
+	assert.Equal(t, "tab    ", sanitizeTerminalText("tab\t"))
+
+	plain := "plain line\nwith ünicode"
+	assert.Equal(t, plain, sanitizeTerminalText(plain))
+	assert.Zero(t, testing.AllocsPerRun(10, func() { _ = sanitizeTerminalText(plain) }))
 }
 
 func TestNewWriter(t *testing.T) {
@@ -619,6 +840,84 @@ func TestWriterTeaMode_ChunkedStreamingRemainsInline(t *testing.T) {
 	assert.Contains(t, output, "done")
 }
 
+func TestWriterTeaMode_MultiLineStreamingChunk(t *testing.T) {
+	var buf bytes.Buffer
+	w := NewWriter(&buf, true, 40, 8)
+
+	state := safety.NewState()
+	state.Iteration = 1
+	item := &domain.WorkItem{ID: "multi-ticket"}
+	w.UpdateFooter(state, item, safety.Config{MaxIterations: 10, StagnationLimit: 3})
+	w.WriteEvent(event.StreamingText("line-1\nline-2\n\nline-4\ntail"))
+	assert.Equal(t, "tail", w.pendingLine)
+	w.WriteEvent(event.StreamingText("-end\n"))
+	assert.Empty(t, w.pendingLine)
+	assert.False(t, w.midLine)
+	w.WriteEvent(event.ToolResult("done"))
+	w.ClearFooter()
+
+	output := stripANSISequences(buf.String())
+	assert.Contains(t, output, "line-1")
+	assert.Contains(t, output, "line-2")
+	assert.Contains(t, output, "line-4")
+	assert.Contains(t, output, "tail-end")
+	assert.Less(t, strings.Index(output, "line-1"), strings.Index(output, "line-4"))
+	assert.Less(t, strings.Index(output, "tail"), strings.Index(output, "done"))
+}
+
+func TestWriterTeaMode_LongUnterminatedLineIsFlushed(t *testing.T) {
+	var buf bytes.Buffer
+	w := NewWriter(&buf, true, 40, 8)
+	w.UpdateFooter(safety.NewState(), &domain.WorkItem{ID: "long-line"}, safety.Config{MaxIterations: 10})
+
+	chunk := strings.Repeat("x", 1000)
+	for range 3 * maxPendingLineBytes / len(chunk) {
+		w.WriteEvent(event.StreamingText(chunk))
+		require.Less(t, len(w.pendingLine), maxPendingLineBytes)
+	}
+	w.ClearFooter()
+
+	assert.Equal(t, 3*maxPendingLineBytes/len(chunk)*len(chunk), strings.Count(buf.String(), "x"))
+}
+
+func TestWriterTeaMode_QueuedOutputKeepsOrder(t *testing.T) {
+	var buf bytes.Buffer
+	w := NewWriter(&buf, true, 40, 8)
+	w.UpdateFooter(safety.NewState(), &domain.WorkItem{ID: "order"}, safety.Config{MaxIterations: 10})
+
+	for i := range 200 {
+		w.WriteEvent(event.Prog(fmt.Sprintf("event-%03d", i)))
+		if i%50 == 0 {
+			w.WriteEvent(event.StreamingText(fmt.Sprintf("stream-%03d\n", i)))
+		}
+	}
+	w.ClearFooter()
+
+	output := stripANSISequences(buf.String())
+	last := -1
+	for i := range 200 {
+		idx := strings.Index(output, fmt.Sprintf("event-%03d", i))
+		require.Greater(t, idx, last, "event-%03d out of order", i)
+		last = idx
+		if i%50 == 0 {
+			idx = strings.Index(output, fmt.Sprintf("stream-%03d", i))
+			require.Greater(t, idx, last, "stream-%03d out of order", i)
+			last = idx
+		}
+	}
+}
+
+func TestBubbleModel_ViewIsFooterAsSent(t *testing.T) {
+	m := &bubbleModel{}
+	assert.Empty(t, m.View())
+
+	_, _ = m.Update(bubbleFooterMsg{view: "sep\nstatus"})
+	assert.Equal(t, "sep\nstatus", m.View())
+
+	_, _ = m.Update(bubbleFooterMsg{})
+	assert.Empty(t, m.View())
+}
+
 func TestWriterTeaMode_ClearFooterFlushesPendingStreaming(t *testing.T) {
 	var buf bytes.Buffer
 	w := NewWriter(&buf, true, 40, 8)
@@ -1076,6 +1375,20 @@ func TestUpdateFooter_ElapsedTimer(t *testing.T) {
 		assert.Contains(t, output, "\033[38;5;255m")
 	})
 
+	t.Run("elapsed label is reformatted only when the second changes", func(t *testing.T) {
+		var buf bytes.Buffer
+		w := newTestWriterTTY(&buf)
+
+		first := w.elapsedLabelLocked(75*time.Second + 100*time.Millisecond)
+		assert.Equal(t, "1m 15s", strings.TrimPrefix(stripANSISequences(first), " | "))
+
+		w.elapsedLabel = "cached"
+		assert.Equal(t, "cached", w.elapsedLabelLocked(75*time.Second+900*time.Millisecond))
+
+		next := w.elapsedLabelLocked(76 * time.Second)
+		assert.Equal(t, "1m 16s", strings.TrimPrefix(stripANSISequences(next), " | "))
+	})
+
 	t.Run("non-TTY footer omits elapsed", func(t *testing.T) {
 		var buf bytes.Buffer
 		w := newTestWriter(&buf)
@@ -24,24 +24,29 @@ type WorkItem struct {
 	ValidationCommands []string
 }
 
-// CurrentPhase returns the first incomplete phase, or nil if all are complete.
-func (w *WorkItem) CurrentPhase() *Phase {
+// CurrentPhaseIndex returns the index of the first incomplete phase, or -1
+// if all phases are complete. Callers that need both the current phase and
+// completeness can derive them from one scan.
+func (w *WorkItem) CurrentPhaseIndex() int {
 	for i := range w.Phases {
 		if !w.Phases[i].Completed {
-			return &w.Phases[i]
+			return i
 		}
 	}
+	return -1
+}
+
+// CurrentPhase returns the first incomplete phase, or nil if all are complete.
+func (w *WorkItem) CurrentPhase() *Phase {
+	if i := w.CurrentPhaseIndex(); i >= 0 {
+		return &w.Phases[i]
+	}
 	return nil
 }
 
 // AllPhasesComplete returns true if all phases are completed.
 func (w *WorkItem) AllPhasesComplete() bool {
-	for _, p := range w.Phases {
-		if !p.Completed {
-			return false
-		}
-	}
-	return len(w.Phases) > 0
+	return len(w.Phases) > 0 && w.CurrentPhaseIndex() < 0
 }
 
 // HasPhases returns true if the work item has any phases defined.
@@ -43,6 +43,25 @@ func TestWorkItem_CurrentPhase(t *testing.T) {
 	}
 }
 
+func TestWorkItem_CurrentPhaseIndex(t *testing.T) {
+	tests := []struct {
+		name   string
+		phases []Phase
+		want   int
+	}{
+		{"no phases", nil, -1},
+		{"all complete", []Phase{{Name: "A", Completed: true}}, -1},
+		{"first incomplete", []Phase{{Name: "A", Completed: true}, {Name: "B", Completed: false}}, 1},
+		{"non-contiguous completion", []Phase{{Name: "A", Completed: false}, {Name: "B", Completed: true}}, 0},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			w := &WorkItem{Phases: tc.phases}
+			assert.Equal(t, tc.want, w.CurrentPhaseIndex())
+		})
+	}
+}
+
 func TestWorkItem_AllPhasesComplete(t *testing.T) {
 	tests := []struct {
 		name   string
@@ -360,6 +360,11 @@ func BranchNameFromSource(sourceID string, isPlan bool) string {
 	return "programmator/" + slug
 }
 
+var (
+	invalidBranchCharsRegex = regexp.MustCompile(`[~^:?*\[\]\\@{}\s]+`)
+	repeatedDashesRegex     = regexp.MustCompile(`-+`)
+)
+
 // sanitizeBranchName makes a string safe for use as a git branch name.
 func sanitizeBranchName(s string) string {
 	// Git branch naming rules:
@@ -368,11 +373,10 @@ func sanitizeBranchName(s string) string {
 	// - Cannot contain consecutive slashes or end with .lock
 
 	// Replace common invalid characters with dashes
-	invalidChars := regexp.MustCompile(`[~^:?*\[\]\\@{}\s]+`)
-	s = invalidChars.ReplaceAllString(s, "-")
+	s = invalidBranchCharsRegex.ReplaceAllString(s, "-")
 
 	// Replace consecutive dashes
-	s = regexp.MustCompile(`-+`).ReplaceAllString(s, "-")
+	s = repeatedDashesRegex.ReplaceAllString(s, "-")
 
 	// Trim leading/trailing dashes and dots
 	s = strings.Trim(s, "-.")
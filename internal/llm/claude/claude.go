@@ -64,6 +64,7 @@ func (c *Invoker) Invoke(ctx context.Context, prompt string, opts llm.InvokeOpti
 	}
 
 	cmd := exec.CommandContext(invokeCtx, "claude", args...)
+	llm.PrepareCommand(cmd)
 	if opts.WorkingDir != "" {
 		cmd.Dir = opts.WorkingDir
 	}
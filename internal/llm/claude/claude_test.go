@@ -6,6 +6,7 @@ import (
 	"slices"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/require"
 
@@ -128,10 +129,13 @@ func TestInvokerTimeout(t *testing.T) {
 	t.Setenv("PATH", tmpDir+":"+os.Getenv("PATH"))
 
 	inv := New(Config{})
+	start := time.Now()
 	res, err := inv.Invoke(context.Background(), "test", llm.InvokeOptions{Timeout: 1})
 	require.NoError(t, err)
 	require.Contains(t, res.Text, protocol.StatusBlockKey)
 	require.Contains(t, res.Text, string(protocol.StatusBlocked))
+	// The shell's sleep child inherits stdout; the timeout must not wait for it.
+	require.Less(t, time.Since(start), 10*time.Second)
 }
 
 func TestInvokerToolUseCallback(t *testing.T) {
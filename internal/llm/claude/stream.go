@@ -2,6 +2,7 @@ package claude
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"io"
 	"strings"
@@ -63,13 +64,15 @@ func processStreamingOutput(r io.Reader, opts llm.InvokeOptions) string {
 	processedBlockIDs := make(map[string]bool)
 
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		// Parse straight from the scanner buffer; json.Unmarshal copies
+		// whatever it keeps, so no per-line string copy is needed.
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
 			continue
 		}
 
 		var event streamEvent
-		if err := json.Unmarshal([]byte(line), &event); err != nil {
+		if err := json.Unmarshal(line, &event); err != nil {
 			debug.Logf("stream: failed to parse JSON: %v (line: %.100s...)", err, line)
 			continue
 		}
@@ -70,6 +70,7 @@ func (c *Invoker) Invoke(ctx context.Context, prompt string, opts llm.InvokeOpti
 	}
 
 	cmd := exec.CommandContext(invokeCtx, "codex", args...)
+	llm.PrepareCommand(cmd)
 	cmd.Env = BuildEnv(c.Env)
 
 	stdout, err := cmd.StdoutPipe()
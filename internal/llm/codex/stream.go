@@ -2,6 +2,7 @@ package codex
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"io"
 	"strings"
@@ -55,13 +56,13 @@ func processCodexStreamingOutput(r io.Reader, model string, opts llm.InvokeOptio
 	hasTokens := false
 
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
 			continue
 		}
 
 		var event codexEvent
-		if err := json.Unmarshal([]byte(line), &event); err != nil {
+		if err := json.Unmarshal(line, &event); err != nil {
 			debug.Logf("codex stream: failed to parse JSON: %v (line: %.100s...)", err, line)
 			continue
 		}
@@ -89,6 +89,7 @@ func (o *Invoker) Invoke(ctx context.Context, prompt string, opts llm.InvokeOpti
 	}
 
 	cmd := exec.CommandContext(invokeCtx, "opencode", args...)
+	llm.PrepareCommand(cmd)
 	cmd.Env = BuildEnv(o.Env)
 
 	stdout, err := cmd.StdoutPipe()
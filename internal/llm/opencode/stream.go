@@ -2,6 +2,7 @@ package opencode
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"io"
 	"strings"
@@ -65,13 +66,13 @@ func processOpenCodeStreamingOutput(r io.Reader, model string, opts llm.InvokeOp
 	hasTokens := false
 
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
 			continue
 		}
 
 		var event ocEvent
-		if err := json.Unmarshal([]byte(line), &event); err != nil {
+		if err := json.Unmarshal(line, &event); err != nil {
 			debug.Logf("opencode stream: failed to parse JSON: %v (line: %.100s...)", err, line)
 			continue
 		}
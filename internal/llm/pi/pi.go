@@ -81,6 +81,7 @@ func (p *Invoker) Invoke(ctx context.Context, prompt string, opts llm.InvokeOpti
 	}
 
 	cmd := exec.CommandContext(invokeCtx, "pi", args...)
+	llm.PrepareCommand(cmd)
 	if opts.WorkingDir != "" {
 		cmd.Dir = opts.WorkingDir
 	}
@@ -2,6 +2,7 @@ package pi
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -78,13 +79,13 @@ func processPiStreamingOutput(r io.Reader, opts llm.InvokeOptions) string {
 	processedToolIDs := make(map[string]bool)
 
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
 			continue
 		}
 
 		var event piEvent
-		if err := json.Unmarshal([]byte(line), &event); err != nil {
+		if err := json.Unmarshal(line, &event); err != nil {
 			debug.Logf("pi stream: failed to parse JSON: %v (line: %.100s...)", err, line)
 			continue
 		}
@@ -0,0 +1,23 @@
+package llm
+
+import (
+	"os/exec"
+	"time"
+)
+
+// processWaitDelay bounds how long an executor command's Wait blocks on its
+// output pipes once the command's context is done. It is a backstop for
+// descendants that escape the process-group kill.
+const processWaitDelay = 5 * time.Second
+
+// PrepareCommand configures an executor command created with
+// exec.CommandContext so that canceling the context (stop or timeout) ends
+// the whole invocation. By default only the direct child is killed; any
+// subprocess it spawned (tool shells, test runners, ...) keeps stdout open
+// and the output reader blocks until that subprocess exits on its own.
+// The command also leaves the terminal's foreground process group, so callers
+// must forward SIGINT/SIGTERM/SIGHUP to it by canceling the context.
+func PrepareCommand(cmd *exec.Cmd) {
+	setProcessGroupKill(cmd)
+	cmd.WaitDelay = processWaitDelay
+}
@@ -0,0 +1,9 @@
+//go:build !unix
+
+package llm
+
+import "os/exec"
+
+// setProcessGroupKill is a no-op where process groups are unavailable;
+// PrepareCommand's WaitDelay still unblocks readers after cancellation.
+func setProcessGroupKill(*exec.Cmd) {}
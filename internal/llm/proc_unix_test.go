@@ -0,0 +1,36 @@
+//go:build unix
+
+package llm
+
+import (
+	"context"
+	"io"
+	"os/exec"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/require"
+)
+
+func TestPrepareCommand_TimeoutKillsProcessGroup(t *testing.T) {
+	ctx, cancel := context.WithTimeout(context.Background(), 200*time.Millisecond)
+	defer cancel()
+
+	// The backgrounded sleep is a grandchild that inherits stdout, like a
+	// tool shell spawned by the executor.
+	cmd := exec.CommandContext(ctx, "sh", "-c", "sleep 30 & sleep 30; wait")
+	PrepareCommand(cmd)
+	stdout, err := cmd.StdoutPipe()
+	require.NoError(t, err)
+	require.NoError(t, cmd.Start())
+
+	start := time.Now()
+	_, err = io.ReadAll(stdout)
+	require.NoError(t, err)
+	// Reaching EOF before processWaitDelay means the grandchild was killed
+	// with the group rather than left holding the pipe open.
+	require.Less(t, time.Since(start), processWaitDelay)
+
+	require.Error(t, cmd.Wait())
+	require.Less(t, time.Since(start), processWaitDelay)
+}
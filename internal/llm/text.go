@@ -1,31 +1,77 @@
 package llm
 
 import (
-	"bufio"
+	"bytes"
+	"errors"
 	"io"
 	"strings"
 
 	"github.com/alexander-akhmetov/programmator/internal/debug"
 )
 
+// maxPendingTextBytes bounds the unterminated tail held back between reads,
+// matching the line limit of the bufio.Scanner this replaced. Longer lines
+// are passed on in pieces.
+const maxPendingTextBytes = 1024 * 1024
+
 // ProcessTextOutput reads plain-text lines from r, calls opts.OnOutput for
-// each line, and returns the accumulated output. Used by all executors in
-// non-streaming mode.
+// each batch of complete lines, and returns the accumulated output. Used by
+// all executors in non-streaming mode.
+//
+// Lines are coalesced at the source: every complete line that arrives in one
+// read is delivered in a single OnOutput call, so a burst of output costs one
+// callback (and one UI event) instead of one per line. Line endings are
+// normalized to "\n" and a final unterminated line gets one appended.
 func ProcessTextOutput(r io.Reader, opts InvokeOptions) string {
 	var output strings.Builder
-	scanner := bufio.NewScanner(r)
-	scanner.Buffer(make([]byte, 1024*1024), 1024*1024)
+	buf := make([]byte, 32*1024)
+	var pending []byte
+	midLine := false // the last emitted chunk did not end a line
 
-	for scanner.Scan() {
-		line := scanner.Text() + "\n"
-		output.WriteString(line)
+	emit := func(chunk []byte) {
+		if bytes.IndexByte(chunk, '\r') >= 0 {
+			chunk = bytes.ReplaceAll(chunk, []byte("\r\n"), []byte("\n"))
+		}
+		output.Write(chunk)
+		midLine = chunk[len(chunk)-1] != '\n'
 		if opts.OnOutput != nil {
-			opts.OnOutput(line)
+			opts.OnOutput(string(chunk))
+		}
+	}
+
+	for {
+		n, err := r.Read(buf)
+		if n > 0 {
+			// Only the new bytes can hold a newline not seen before.
+			prev := len(pending)
+			pending = append(pending, buf[:n]...)
+			if i := bytes.LastIndexByte(buf[:n], '\n'); i >= 0 {
+				i += prev
+				emit(pending[:i+1])
+				pending = append(pending[:0], pending[i+1:]...)
+			} else if len(pending) >= maxPendingTextBytes {
+				// Hold back a trailing CR: its LF may arrive in the next read.
+				cut := len(pending)
+				if pending[cut-1] == '\r' {
+					cut--
+				}
+				if cut > 0 {
+					emit(pending[:cut])
+					pending = append(pending[:0], pending[cut:]...)
+				}
+			}
+		}
+		if err != nil {
+			if !errors.Is(err, io.EOF) {
+				debug.Logf("stream: text read error: %v", err)
+			}
+			break
 		}
 	}
 
-	if err := scanner.Err(); err != nil {
-		debug.Logf("stream: text scanner error: %v", err)
+	pending = bytes.TrimSuffix(pending, []byte("\r"))
+	if len(pending) > 0 || midLine {
+		emit(append(pending, '\n'))
 	}
 
 	return output.String()
@@ -0,0 +1,81 @@
+package llm
+
+import (
+	"strings"
+	"testing"
+	"testing/iotest"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestProcessTextOutput(t *testing.T) {
+	tests := []struct {
+		name  string
+		input string
+		want  string
+	}{
+		{name: "empty", input: "", want: ""},
+		{name: "single line", input: "hello\n", want: "hello\n"},
+		{name: "missing trailing newline", input: "a\nb", want: "a\nb\n"},
+		{name: "blank lines", input: "a\n\nb\n", want: "a\n\nb\n"},
+		{name: "crlf", input: "a\r\nb\r\n", want: "a\nb\n"},
+		{name: "unterminated crlf", input: "a\r\nb\r", want: "a\nb\n"},
+		{name: "lone carriage return kept", input: "a\rb\n", want: "a\rb\n"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var chunks []string
+			got := ProcessTextOutput(strings.NewReader(tt.input), InvokeOptions{
+				OnOutput: func(text string) { chunks = append(chunks, text) },
+			})
+			assert.Equal(t, tt.want, got)
+			assert.Equal(t, tt.want, strings.Join(chunks, ""))
+
+			assert.Equal(t, tt.want, ProcessTextOutput(strings.NewReader(tt.input), InvokeOptions{}))
+			assert.Equal(t, tt.want, ProcessTextOutput(iotest.OneByteReader(strings.NewReader(tt.input)), InvokeOptions{}))
+		})
+	}
+}
+
+func TestProcessTextOutput_CoalescesLinesPerRead(t *testing.T) {
+	var chunks []string
+	got := ProcessTextOutput(strings.NewReader("one\ntwo\nthree\npartial"), InvokeOptions{
+		OnOutput: func(text string) { chunks = append(chunks, text) },
+	})
+
+	assert.Equal(t, "one\ntwo\nthree\npartial\n", got)
+	assert.Equal(t, []string{"one\ntwo\nthree\n", "partial\n"}, chunks)
+}
+
+func TestProcessTextOutput_LongLineIsPassedOnInPieces(t *testing.T) {
+	payload := strings.Repeat("x", 3*maxPendingTextBytes+100)
+
+	var chunks []string
+	got := ProcessTextOutput(strings.NewReader(payload), InvokeOptions{
+		OnOutput: func(text string) { chunks = append(chunks, text) },
+	})
+
+	assert.Equal(t, payload+"\n", got)
+	assert.Equal(t, payload+"\n", strings.Join(chunks, ""))
+	assert.Greater(t, len(chunks), 3)
+	for _, chunk := range chunks {
+		assert.LessOrEqual(t, len(chunk), maxPendingTextBytes+32*1024)
+	}
+}
+
+func TestProcessTextOutput_CRLFSplitAtPendingLimit(t *testing.T) {
+	// The reads fill the pending tail up to the limit exactly on the CR, so
+	// the LF only arrives with the next read.
+	line := strings.Repeat("x", maxPendingTextBytes-1)
+	input := line + "\r\nrest\r\n"
+
+	var chunks []string
+	got := ProcessTextOutput(strings.NewReader(input), InvokeOptions{
+		OnOutput: func(text string) { chunks = append(chunks, text) },
+	})
+
+	assert.Equal(t, line+"\nrest\n", got)
+	assert.Equal(t, got, strings.Join(chunks, ""))
+	assert.Greater(t, len(chunks), 1, "the long line should have been flushed before its newline")
+}
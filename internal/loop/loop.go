@@ -9,7 +9,6 @@ import (
 	"strconv"
 	"strings"
 	"sync"
-	"sync/atomic"
 	"time"
 	"unicode"
 
@@ -62,11 +61,13 @@ type Loop struct {
 	onStateChange  StateCallback
 	onProcessStats ProcessStatsCallback
 	streaming      bool
-	cancelFunc     context.CancelFunc
 	source         source.Source
 	invoker        llm.Invoker
 
-	stopRequested atomic.Bool
+	// stopCh is closed by Stop; Run watches it to cancel in-flight work
+	// instead of polling a flag.
+	stopCh   chan struct{}
+	stopOnce sync.Once
 
 	currentState    *safety.State
 	currentWorkItem *domain.WorkItem
@@ -112,6 +113,7 @@ func NewWithSource(config safety.Config, workingDir string, onStateChange StateC
 		onStateChange: onStateChange,
 		streaming:     streaming,
 		source:        src,
+		stopCh:        make(chan struct{}),
 		reviewConfig:  review.DefaultConfig(),
 		engine: Engine{
 			SafetyConfig: config,
@@ -284,6 +286,10 @@ const (
 	loopRetryReview
 )
 
+// recentSummaryLimit is how many iteration summaries are kept for
+// stagnation debugging; older ones are dropped as new ones arrive.
+const recentSummaryLimit = 5
+
 // runContext holds mutable state for a single Run invocation.
 type runContext struct {
 	ctx                context.Context
@@ -293,14 +299,15 @@ type runContext struct {
 	result             *Result
 	filesChangedSet    map[string]struct{}
 	workItem           *domain.WorkItem
-	iterationSummaries []string // Track summaries for each iteration
+	workItemStale      bool     // workItem may be outdated and must be refetched
+	iterationSummaries []string // Summaries of the last recentSummaryLimit iterations
 	taskCompleted      bool     // Claude reported DONE for the task
 }
 
 // checkStopRequested checks if stop was requested and handles the response.
 // Returns loopReturn if we should exit, loopContinue otherwise.
 func (l *Loop) checkStopRequested(rc *runContext) loopAction {
-	if l.stopRequested.Load() {
+	if l.stopRequested() {
 		l.log("Stop requested by user")
 		_ = rc.source.AddNote(rc.workItemID, fmt.Sprintf("progress: Stopped by user after %d iterations", rc.state.Iteration))
 		rc.result.ExitReason = safety.ExitReasonUserInterrupt
@@ -501,8 +508,7 @@ func (l *Loop) processClaudeStatus(rc *runContext, status *parser.ParsedStatus)
 	l.trackFilesChanged(rc, status)
 
 	// Track iteration summary for stagnation debugging
-	rc.iterationSummaries = append(rc.iterationSummaries,
-		FormatIterationSummary(rc.state.Iteration, status.Summary, status.FilesChanged))
+	rc.addIterationSummary(FormatIterationSummary(rc.state.Iteration, status.Summary, status.FilesChanged))
 
 	rc.state.RecordIteration(status.FilesChanged, status.Error)
 	if phaseProgressed {
@@ -697,12 +703,51 @@ func (l *Loop) trackFilesChanged(rc *runContext, status *parser.ParsedStatus) {
 	}
 }
 
+// watchStop cancels in-flight invocations as soon as Stop is called.
+// The watcher exits when ctx is done.
+func (l *Loop) watchStop(ctx context.Context, cancel context.CancelFunc) {
+	go func() {
+		select {
+		case <-l.stopCh:
+			cancel()
+		case <-ctx.Done():
+		}
+	}()
+}
+
+// ensureInProgress marks the work item in progress. Resumed work items
+// already are, so the redundant source call is skipped for them.
+func ensureInProgress(src source.Source, workItemID string, workItem *domain.WorkItem) {
+	if workItem.Status == protocol.WorkItemInProgress {
+		return
+	}
+	_ = src.SetStatus(workItemID, protocol.WorkItemInProgress)
+	workItem.Status = protocol.WorkItemInProgress
+}
+
+// refreshWorkItemIfStale refetches the work item if the executor ran since
+// the last fetch. It only changes then (the executor may edit the source
+// itself, and phase updates follow its status), so other iterations reuse
+// the cached copy.
+func (rc *runContext) refreshWorkItemIfStale() error {
+	if !rc.workItemStale {
+		return nil
+	}
+	workItem, err := rc.source.Get(rc.workItemID)
+	if err != nil {
+		return err
+	}
+	rc.workItem = workItem
+	rc.workItemStale = false
+	return nil
+}
+
 func (l *Loop) Run(workItemID string) (*Result, error) {
 	timing.Log("Loop.Run: start")
 	startTime := time.Now()
 	ctx, cancel := context.WithCancel(context.Background())
-	l.cancelFunc = cancel
 	defer cancel()
+	l.watchStop(ctx, cancel)
 
 	timing.Log("Loop.Run: creating source")
 	src := l.source
@@ -739,7 +784,7 @@ func (l *Loop) Run(workItemID string) (*Result, error) {
 		return result, err
 	}
 
-	_ = src.SetStatus(workItemID, protocol.WorkItemInProgress)
+	ensureInProgress(src, workItemID, workItem)
 
 	// Set up git repo and optionally create branch
 	if err := l.setupGitWorkflow(workItemID, src.Type() == protocol.SourceTypePlan); err != nil {
@@ -769,8 +814,7 @@ func (l *Loop) Run(workItemID string) (*Result, error) {
 			return rc.result, nil
 		}
 
-		rc.workItem, err = rc.source.Get(rc.workItemID)
-		if err != nil {
+		if err := rc.refreshWorkItemIfStale(); err != nil {
 			rc.result.ExitReason = safety.ExitReasonError
 			return rc.result, err
 		}
@@ -793,7 +837,7 @@ func (l *Loop) Run(workItemID string) (*Result, error) {
 			rc.result.ExitReason = checkResult.Reason
 			rc.result.ExitMessage = checkResult.Message
 			rc.result.Iterations = rc.state.Iteration
-			rc.result.RecentSummaries = l.getRecentSummaries(rc, 5)
+			rc.result.RecentSummaries = l.getRecentSummaries(rc, recentSummaryLimit)
 			return rc.result, nil
 		}
 
@@ -833,6 +877,7 @@ func (l *Loop) Run(workItemID string) (*Result, error) {
 
 		l.log(fmt.Sprintf("Invoking %s...", l.executorName()))
 
+		rc.workItemStale = true
 		output, err := l.invokeClaudePrint(ctx, promptText)
 		if err != nil {
 			l.log(fmt.Sprintf("Invocation failed: %v", err))
@@ -1140,10 +1185,21 @@ func formatToolArg(toolName string, input map[string]any) string {
 	return ""
 }
 
+// Stop requests the loop to exit. It is safe to call from any goroutine and
+// more than once; a running invocation is canceled immediately.
 func (l *Loop) Stop() {
-	l.stopRequested.Store(true)
-	if l.cancelFunc != nil {
-		l.cancelFunc()
+	l.stopOnce.Do(func() {
+		close(l.stopCh)
+	})
+}
+
+// stopRequested reports whether Stop has been called.
+func (l *Loop) stopRequested() bool {
+	select {
+	case <-l.stopCh:
+		return true
+	default:
+		return false
 	}
 }
 
@@ -1190,6 +1246,19 @@ func (r *Result) FilesChangedList() []string {
 	return r.TotalFilesChanged
 }
 
+// addIterationSummary records an iteration summary, dropping the oldest one
+// once recentSummaryLimit are held so long runs stay bounded.
+func (rc *runContext) addIterationSummary(summary string) {
+	if rc.iterationSummaries == nil {
+		rc.iterationSummaries = make([]string, 0, recentSummaryLimit)
+	}
+	if len(rc.iterationSummaries) == recentSummaryLimit {
+		copy(rc.iterationSummaries, rc.iterationSummaries[1:])
+		rc.iterationSummaries = rc.iterationSummaries[:recentSummaryLimit-1]
+	}
+	rc.iterationSummaries = append(rc.iterationSummaries, summary)
+}
+
 // getRecentSummaries returns the last n iteration summaries for debugging.
 func (l *Loop) getRecentSummaries(rc *runContext, n int) []string {
 	if len(rc.iterationSummaries) <= n {
@@ -62,9 +62,12 @@ func TestLoopStop(t *testing.T) {
 
 	l.Stop()
 
-	if !l.stopRequested.Load() {
+	if !l.stopRequested() {
 		t.Error("stopRequested should be true after Stop()")
 	}
+
+	// Stop must be idempotent.
+	l.Stop()
 }
 
 // NOTE: processTextOutput, processStreamingOutput, and timeoutBlockedStatus
@@ -367,6 +370,33 @@ func TestRunAllPhasesCompleteAtStart(t *testing.T) {
 	require.Equal(t, safety.ExitReasonComplete, result.ExitReason)
 	require.Equal(t, 0, result.Iterations)
 	require.Len(t, mock.SetStatusCalls, 2)
+	require.Len(t, mock.GetCalls, 1, "work item should not be refetched without an invocation")
+}
+
+func TestRunSkipsInProgressStatusWhenAlreadyInProgress(t *testing.T) {
+	mock := source.NewMockSource()
+	mock.GetFunc = func(_ string) (*domain.WorkItem, error) {
+		return &domain.WorkItem{
+			ID:     "test-123",
+			Title:  "Test Ticket",
+			Status: protocol.WorkItemInProgress,
+			Phases: []domain.Phase{
+				{Name: "Phase 1", Completed: true},
+			},
+		}, nil
+	}
+
+	config := safety.Config{MaxIterations: 10, StagnationLimit: 3, Timeout: 60}
+	l := NewWithSource(config, "", nil, false, mock)
+	l.SetReviewConfig(singleAgentReviewConfig())
+	l.SetReviewRunner(createMockReviewRunner(t, false, 0))
+
+	result, err := l.Run("test-123")
+
+	require.NoError(t, err)
+	require.Equal(t, safety.ExitReasonComplete, result.ExitReason)
+	require.Len(t, mock.SetStatusCalls, 1)
+	require.Equal(t, protocol.WorkItemClosed, mock.SetStatusCalls[0].Status)
 }
 
 func TestRunGetTicketError(t *testing.T) {
@@ -1933,6 +1963,17 @@ func TestRunRecentSummariesPopulated(t *testing.T) {
 	require.GreaterOrEqual(t, len(result.RecentSummaries), 2, "should have summaries from multiple iterations")
 }
 
+func TestAddIterationSummaryKeepsMostRecent(t *testing.T) {
+	rc := &runContext{}
+	for i := 1; i <= 12; i++ {
+		rc.addIterationSummary(fmt.Sprintf("iter %d", i))
+		require.LessOrEqual(t, len(rc.iterationSummaries), recentSummaryLimit)
+	}
+
+	require.Equal(t, []string{"iter 8", "iter 9", "iter 10", "iter 11", "iter 12"}, rc.iterationSummaries)
+	require.Equal(t, recentSummaryLimit, cap(rc.iterationSummaries), "backing array should not grow")
+}
+
 // TestRunEventEmissionDuringFullRun verifies that events are emitted during Run
 // when an event callback is set.
 func TestRunEventEmissionDuringFullRun(t *testing.T) {
@@ -2,7 +2,6 @@
 package parser
 
 import (
-	"regexp"
 	"strings"
 
 	"gopkg.in/yaml.v3"
@@ -30,23 +29,21 @@ func (p *ParsedStatus) IsValid() bool {
 	return p.Status.IsValid()
 }
 
-// statusBlockRegex matches PROGRAMMATOR_STATUS: blocks in Claude output.
-// It handles both cases:
-// 1. Status block followed by closing backticks (```)
-// 2. Status block at end of output with no closing backticks
-var statusBlockRegex = regexp.MustCompile(`(?s)` + protocol.StatusBlockKey + `:\s*\n(.*?)(?:\n\s*\x60{3}|$)`)
-
 // Parse extracts and parses a PROGRAMMATOR_STATUS block from Claude output.
 // Returns nil, nil if no status block is found.
 // Returns nil, error if the status block is malformed.
 func Parse(output string) (*ParsedStatus, error) {
-	match := statusBlockRegex.FindStringSubmatch(output)
-	if match == nil {
+	block, ok := findStatusBlock(output)
+	if !ok {
 		return nil, nil
 	}
 
-	yamlContent := protocol.StatusBlockKey + ":\n" + match[1]
-	yamlContent = strings.TrimRight(yamlContent, "`\n ")
+	body := strings.TrimRight(block, "`\n ")
+	if status, ok := parseStatusFields(body); ok {
+		return status, nil
+	}
+
+	yamlContent := protocol.StatusBlockKey + ":\n" + body
 
 	var wrapper struct {
 		Status ParsedStatus `yaml:"PROGRAMMATOR_STATUS"`
@@ -59,6 +56,248 @@ func Parse(output string) (*ParsedStatus, error) {
 	return &wrapper.Status, nil
 }
 
+// findStatusBlock returns the body of the status block in output.
+// The status block is emitted at the end of a response, so occurrences of
+// the status key are tried from the last one backwards and the first that
+// forms a block wins. Key mentions in prose (e.g. the key quoted after the
+// block) are skipped without rescanning the transcript from the start.
+func findStatusBlock(output string) (string, bool) {
+	key := protocol.StatusBlockKey + ":"
+	for idx := strings.LastIndex(output, key); idx >= 0; idx = strings.LastIndex(output[:idx], key) {
+		if body, ok := statusBlockBody(output[idx+len(key):]); ok {
+			return body, true
+		}
+	}
+	return "", false
+}
+
+// statusBlockBody extracts a block body from the text following the status
+// key. The whitespace after the key must contain a line break; the body
+// starts after the last one and ends before the first line break followed
+// by optional whitespace and closing backticks (```), or at the end of the
+// text when the block is not fenced.
+func statusBlockBody(rest string) (string, bool) {
+	i := 0
+	for i < len(rest) && isBlockSpace(rest[i]) {
+		i++
+	}
+	nl := strings.LastIndexByte(rest[:i], '\n')
+	if nl < 0 {
+		return "", false
+	}
+	body := rest[nl+1:]
+
+	for off := 0; ; {
+		q := strings.Index(body[off:], "```")
+		if q < 0 {
+			return body, true
+		}
+		q += off
+		ws := q
+		for ws > 0 && isBlockSpace(body[ws-1]) {
+			ws--
+		}
+		if end := strings.IndexByte(body[ws:q], '\n'); end >= 0 {
+			return body[:ws+end], true
+		}
+		off = q + 1
+	}
+}
+
+// isBlockSpace reports whether c is whitespace in the sense of regexp's \s.
+func isBlockSpace(c byte) bool {
+	return c == ' ' || c == '\t' || c == '\n' || c == '\f' || c == '\r'
+}
+
+// parseStatusFields is a fast path for the flat key/value shape the prompt
+// templates ask executors to emit: one indented "key: value" line per field,
+// with files_changed given as a flow list ([] or [a, b]) or as "- item"
+// lines. It returns ok=false for anything outside that shape (comments,
+// multi-line scalars, escapes, unknown or duplicate keys, ...) so that Parse
+// falls back to the YAML decoder and keeps its exact semantics and errors.
+func parseStatusFields(body string) (*ParsedStatus, bool) {
+	status := &ParsedStatus{}
+	var seen uint8 // statusFieldBit of each key already parsed
+	keyIndent := -1
+	itemIndent := -1
+	inList := false // files_changed with items expected on following lines
+
+	for line := range strings.SplitSeq(body, "\n") {
+		if strings.TrimSpace(line) == "" {
+			continue
+		}
+		if strings.ContainsAny(line, "\t\r") {
+			return nil, false
+		}
+		content := strings.TrimLeft(line, " ")
+		indent := len(line) - len(content)
+
+		if keyIndent < 0 {
+			if indent == 0 {
+				return nil, false
+			}
+			keyIndent = indent
+		}
+
+		if indent > keyIndent {
+			if !inList || !strings.HasPrefix(content, "- ") {
+				return nil, false
+			}
+			if itemIndent < 0 {
+				itemIndent = indent
+			} else if indent != itemIndent {
+				return nil, false
+			}
+			item, isNull, ok := parseStatusScalar(content[2:])
+			if !ok || isNull {
+				return nil, false
+			}
+			status.FilesChanged = append(status.FilesChanged, item)
+			continue
+		}
+		if indent < keyIndent {
+			return nil, false
+		}
+
+		key, value, found := strings.Cut(content, ":")
+		if !found {
+			return nil, false
+		}
+		bit, listFollows, ok := applyStatusField(status, key, value)
+		if !ok || seen&bit != 0 {
+			return nil, false
+		}
+		seen |= bit
+		inList = listFollows
+		itemIndent = -1
+	}
+
+	return status, true
+}
+
+// applyStatusField parses the value of one "key: value" line into status.
+// It returns the key's statusFieldBit, whether "- item" lines for
+// files_changed follow, and ok=false if the line is outside the fast path's
+// shape.
+func applyStatusField(status *ParsedStatus, key, value string) (bit uint8, listFollows, ok bool) {
+	bit = statusFieldBit(key)
+	if bit == 0 || (value != "" && value[0] != ' ') {
+		return 0, false, false
+	}
+
+	if key == "files_changed" {
+		value = strings.TrimSpace(value)
+		if value == "" {
+			return bit, true, true
+		}
+		files, ok := parseStatusFlowList(value)
+		if !ok {
+			return 0, false, false
+		}
+		status.FilesChanged = files
+		return bit, false, true
+	}
+
+	text, isNull, ok := parseStatusScalar(value)
+	if !ok {
+		return 0, false, false
+	}
+	switch key {
+	case "phase_completed":
+		status.PhaseCompleted = text
+	case "status":
+		status.Status = Status(text)
+	case "summary":
+		status.Summary = text
+	case "error":
+		status.Error = text
+	case "commit_made":
+		switch {
+		case isNull:
+		case text == "true":
+			status.CommitMade = true
+		case text == "false":
+		default:
+			return 0, false, false
+		}
+	}
+	return bit, false, true
+}
+
+// statusFieldBit maps a status key to its bit in parseStatusFields' seen
+// set, or 0 for keys the fast path does not handle.
+func statusFieldBit(key string) uint8 {
+	switch key {
+	case "phase_completed":
+		return 1 << 0
+	case "status":
+		return 1 << 1
+	case "files_changed":
+		return 1 << 2
+	case "summary":
+		return 1 << 3
+	case "error":
+		return 1 << 4
+	case "commit_made":
+		return 1 << 5
+	}
+	return 0
+}
+
+// parseStatusFlowList parses an inline list such as [] or [a.go, "b.go"].
+func parseStatusFlowList(value string) ([]string, bool) {
+	if len(value) < 2 || value[0] != '[' || value[len(value)-1] != ']' {
+		return nil, false
+	}
+	inner := strings.TrimSpace(value[1 : len(value)-1])
+	if inner == "" {
+		return []string{}, true
+	}
+	if strings.ContainsAny(inner, "[]{}") {
+		return nil, false
+	}
+	items := strings.Split(inner, ",")
+	files := make([]string, 0, len(items))
+	for _, item := range items {
+		text, isNull, ok := parseStatusScalar(item)
+		if !ok || isNull {
+			return nil, false
+		}
+		files = append(files, text)
+	}
+	return files, true
+}
+
+// parseStatusScalar parses a single-line YAML scalar. Quoted values are
+// accepted only when they contain no escapes; plain values are rejected when
+// YAML could read them as anything other than a plain string.
+func parseStatusScalar(value string) (text string, isNull, ok bool) {
+	value = strings.TrimSpace(value)
+	switch value {
+	case "", "~", "null", "Null", "NULL":
+		return "", true, true
+	}
+
+	switch quote := value[0]; quote {
+	case '"', '\'':
+		inner := value[1:]
+		if len(inner) == 0 || inner[len(inner)-1] != quote {
+			return "", false, false
+		}
+		inner = inner[:len(inner)-1]
+		if strings.IndexByte(inner, quote) >= 0 || (quote == '"' && strings.IndexByte(inner, '\\') >= 0) {
+			return "", false, false
+		}
+		return inner, false, true
+	}
+
+	if strings.ContainsRune("-?:,[]{}#&*!|>%@`", rune(value[0])) ||
+		strings.Contains(value, ": ") || strings.Contains(value, " #") || strings.HasSuffix(value, ":") {
+		return "", false, false
+	}
+	return value, false, true
+}
+
 // ParseDirect parses YAML content directly into a ParsedStatus struct.
 // This is useful for testing or when the YAML is already extracted.
 func ParseDirect(output string) (*ParsedStatus, error) {
@@ -1,8 +1,13 @@
 package parser
 
 import (
+	"regexp"
+	"strings"
 	"testing"
 
+	"github.com/stretchr/testify/require"
+	"gopkg.in/yaml.v3"
+
 	"github.com/alexander-akhmetov/programmator/internal/protocol"
 )
 
@@ -215,6 +220,209 @@ PROGRAMMATOR_STATUS:
 	}
 }
 
+func TestParseUsesLastStatusBlock(t *testing.T) {
+	tests := []struct {
+		name        string
+		output      string
+		wantSummary string
+	}{
+		{
+			name: "later block wins",
+			output: `PROGRAMMATOR_STATUS:
+  phase_completed: null
+  status: CONTINUE
+  files_changed: []
+  summary: "first"
+` + "```" + `
+More work happened.
+
+PROGRAMMATOR_STATUS:
+  phase_completed: null
+  status: DONE
+  files_changed: []
+  summary: "second"
+`,
+			wantSummary: "second",
+		},
+		{
+			name: "trailing inline mention falls back to earlier block",
+			output: `PROGRAMMATOR_STATUS:
+  phase_completed: null
+  status: CONTINUE
+  files_changed: []
+  summary: "only block"
+` + "```" + `
+I reported PROGRAMMATOR_STATUS: above.`,
+			wantSummary: "only block",
+		},
+		{
+			name: "inline mentions around block are skipped",
+			output: `I will emit PROGRAMMATOR_STATUS: at the end.
+
+PROGRAMMATOR_STATUS:
+  phase_completed: null
+  status: CONTINUE
+  files_changed: []
+  summary: "middle"
+` + "```" + `
+See PROGRAMMATOR_STATUS: above, and PROGRAMMATOR_STATUS: again.`,
+			wantSummary: "middle",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := Parse(tt.output)
+			if err != nil {
+				t.Fatalf("Parse() unexpected error: %v", err)
+			}
+			if got == nil {
+				t.Fatal("Parse() returned nil")
+			}
+			if got.Summary != tt.wantSummary {
+				t.Errorf("Summary = %q, want %q", got.Summary, tt.wantSummary)
+			}
+		})
+	}
+}
+
+func TestFindStatusBlockMatchesRegex(t *testing.T) {
+	blockRegex := regexp.MustCompile(`(?s)` + protocol.StatusBlockKey + `:\s*\n(.*?)(?:\n\s*\x60{3}|$)`)
+	fence := "```"
+	outputs := []string{
+		"",
+		"no block here",
+		"PROGRAMMATOR_STATUS:",
+		"PROGRAMMATOR_STATUS: inline mention",
+		"PROGRAMMATOR_STATUS:\n  status: DONE",
+		"PROGRAMMATOR_STATUS:\n  status: DONE\n",
+		"PROGRAMMATOR_STATUS:  \r\n\n\t  status: DONE\n" + fence + "\ntrailing",
+		"PROGRAMMATOR_STATUS:\n  status: DONE\n\n   " + fence,
+		"PROGRAMMATOR_STATUS:\n" + fence,
+		"PROGRAMMATOR_STATUS:\n\n" + fence,
+		"PROGRAMMATOR_STATUS:\n  summary: uses " + fence + "code" + fence + "\n" + fence,
+		"PROGRAMMATOR_STATUS:\n  status: DONE " + fence + "\n\n" + fence + "`\n",
+		"PROGRAMMATOR_STATUS:\n  a\n" + fence + "\nPROGRAMMATOR_STATUS:\n  b\n" + fence,
+		"PROGRAMMATOR_STATUS:\n  a\n" + fence + "\nsee PROGRAMMATOR_STATUS: above",
+		"xPROGRAMMATOR_STATUS:\n  status: CONTINUE\n\f" + fence,
+	}
+
+	for _, output := range outputs {
+		t.Run(output, func(t *testing.T) {
+			got, ok := findStatusBlock(output)
+
+			var want []string
+			key := protocol.StatusBlockKey + ":"
+			for idx := len(output); want == nil; {
+				idx = strings.LastIndex(output[:idx], key)
+				if idx < 0 {
+					break
+				}
+				want = blockRegex.FindStringSubmatch(output[idx:])
+			}
+
+			require.Equal(t, want != nil, ok)
+			if want != nil {
+				require.Equal(t, want[1], got)
+			}
+		})
+	}
+}
+
+func TestParseStatusFieldsMatchesYAML(t *testing.T) {
+	tests := []struct {
+		name     string
+		body     string
+		wantFast bool
+	}{
+		{
+			name: "block list and quoted values",
+			body: `  phase_completed: "Phase 1: Setup"
+  status: CONTINUE
+  files_changed:
+    - main.go
+    - "dir/util.go"
+  summary: 'Implemented setup'
+  commit_made: true`,
+			wantFast: true,
+		},
+		{
+			name: "flow list and nulls",
+			body: `  phase_completed: null
+  status: BLOCKED
+  files_changed: [a.go, "b.go", 'c.go']
+  summary: Plain summary, with comma
+  error: ~
+  commit_made: false`,
+			wantFast: true,
+		},
+		{
+			name: "empty flow list and empty values",
+			body: `  phase_completed:
+  status: DONE
+  files_changed: []
+  summary: ""`,
+			wantFast: true,
+		},
+		{
+			name:     "files_changed without items",
+			body:     "  status: CONTINUE\n  files_changed:\n  summary: x",
+			wantFast: true,
+		},
+		{
+			name:     "escaped quotes fall back",
+			body:     `  status: CONTINUE` + "\n" + `  summary: "say \"hi\""`,
+			wantFast: false,
+		},
+		{
+			name:     "comment falls back",
+			body:     "  status: CONTINUE # done\n  summary: x",
+			wantFast: false,
+		},
+		{
+			name:     "multi-line scalar falls back",
+			body:     "  status: CONTINUE\n  summary: |\n    line one\n    line two",
+			wantFast: false,
+		},
+		{
+			name:     "unknown key falls back",
+			body:     "  status: CONTINUE\n  notes: extra",
+			wantFast: false,
+		},
+		{
+			name:     "duplicate key falls back",
+			body:     "  status: CONTINUE\n  status: DONE",
+			wantFast: false,
+		},
+		{
+			name:     "unindented body falls back",
+			body:     "status: CONTINUE",
+			wantFast: false,
+		},
+		{
+			name:     "yes/no commit_made falls back",
+			body:     "  status: CONTINUE\n  commit_made: yes",
+			wantFast: false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			fast, ok := parseStatusFields(tt.body)
+			require.Equal(t, tt.wantFast, ok)
+			if !ok {
+				return
+			}
+
+			var wrapper struct {
+				Status ParsedStatus `yaml:"PROGRAMMATOR_STATUS"`
+			}
+			require.NoError(t, yaml.Unmarshal([]byte(protocol.StatusBlockKey+":\n"+tt.body), &wrapper))
+			require.Equal(t, &wrapper.Status, fast)
+		})
+	}
+}
+
 func TestParseCommitMade(t *testing.T) {
 	tests := []struct {
 		name           string
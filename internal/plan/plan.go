@@ -174,36 +174,35 @@ func (p *Plan) AllTasksComplete() bool {
 func (p *Plan) MarkTaskComplete(taskName string) error {
 	normalizedName := normalizeTaskName(taskName)
 
-	// First pass: exact match
+	// Normalize each open task name once; all three passes compare against it.
+	existing := make([]string, len(p.Tasks))
 	for i := range p.Tasks {
 		if !p.Tasks[i].Completed {
-			existingName := normalizeTaskName(p.Tasks[i].Name)
-			if existingName == normalizedName {
-				p.Tasks[i].Completed = true
-				return nil
-			}
+			existing[i] = normalizeTaskName(p.Tasks[i].Name)
+		}
+	}
+
+	// First pass: exact match
+	for i := range p.Tasks {
+		if !p.Tasks[i].Completed && existing[i] == normalizedName {
+			p.Tasks[i].Completed = true
+			return nil
 		}
 	}
 
 	// Second pass: existing task name contains the query (not vice versa)
 	for i := range p.Tasks {
-		if !p.Tasks[i].Completed {
-			existingName := normalizeTaskName(p.Tasks[i].Name)
-			if strings.Contains(existingName, normalizedName) {
-				p.Tasks[i].Completed = true
-				return nil
-			}
+		if !p.Tasks[i].Completed && strings.Contains(existing[i], normalizedName) {
+			p.Tasks[i].Completed = true
+			return nil
 		}
 	}
 
 	// Third pass: query contains existing task name (Claude elaborated)
 	for i := range p.Tasks {
-		if !p.Tasks[i].Completed {
-			existingName := normalizeTaskName(p.Tasks[i].Name)
-			if strings.Contains(normalizedName, existingName) {
-				p.Tasks[i].Completed = true
-				return nil
-			}
+		if !p.Tasks[i].Completed && strings.Contains(normalizedName, existing[i]) {
+			p.Tasks[i].Completed = true
+			return nil
 		}
 	}
 
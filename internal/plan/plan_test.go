@@ -246,6 +246,23 @@ func TestMarkTaskComplete_ReverseContains(t *testing.T) {
 	assert.True(t, plan.Tasks[1].Completed)
 }
 
+func TestMarkTaskComplete_ExactMatchWinsOverContains(t *testing.T) {
+	plan := &Plan{
+		Tasks: []Task{
+			{Name: "Task 1: Build docs", Completed: false},
+			{Name: "Task 2: Build", Completed: false},
+			{Name: "Task 3: Build", Completed: true},
+		},
+	}
+
+	require.NoError(t, plan.MarkTaskComplete("build"))
+	assert.False(t, plan.Tasks[0].Completed)
+	assert.True(t, plan.Tasks[1].Completed)
+
+	require.NoError(t, plan.MarkTaskComplete("Build"))
+	assert.True(t, plan.Tasks[0].Completed, "falls back to a containing name once the exact one is done")
+}
+
 func TestMarkTaskComplete_AlreadyCompleted(t *testing.T) {
 	plan := &Plan{
 		Tasks: []Task{
@@ -42,9 +42,8 @@ type State struct {
 	ConsecutiveNoChanges int
 	LastError            string
 	ConsecutiveErrors    int
-	FilesChangedHistory  [][]string
 	TotalFilesChanged    map[string]struct{}
-	StartTime            time.Time
+	StartTime            time.Time // carries a monotonic reading, so elapsed time ignores wall-clock jumps
 	Model                string
 	TokensByModel        map[string]*ModelTokens
 	CurrentIterTokens    *ModelTokens // live tokens for current iteration
@@ -54,16 +53,13 @@ type State struct {
 
 func NewState() *State {
 	return &State{
-		FilesChangedHistory: make([][]string, 0),
-		TotalFilesChanged:   make(map[string]struct{}),
-		StartTime:           time.Now(),
-		TokensByModel:       make(map[string]*ModelTokens),
+		TotalFilesChanged: make(map[string]struct{}),
+		StartTime:         time.Now(),
+		TokensByModel:     make(map[string]*ModelTokens),
 	}
 }
 
 func (s *State) RecordIteration(filesChanged []string, err string) {
-	s.FilesChangedHistory = append(s.FilesChangedHistory, filesChanged)
-
 	if len(filesChanged) > 0 {
 		s.ConsecutiveNoChanges = 0
 		for _, f := range filesChanged {
@@ -16,12 +16,14 @@ func TestNewState(t *testing.T) {
 	if state.ConsecutiveErrors != 0 {
 		t.Errorf("ConsecutiveErrors = %d, want 0", state.ConsecutiveErrors)
 	}
-	if state.FilesChangedHistory == nil {
-		t.Error("FilesChangedHistory should not be nil")
-	}
 	if state.TotalFilesChanged == nil {
 		t.Error("TotalFilesChanged should not be nil")
 	}
+	// Round(0) strips the monotonic reading, so the two compare equal only
+	// when there was none to strip.
+	if state.StartTime == state.StartTime.Round(0) {
+		t.Errorf("StartTime %v should carry a monotonic clock reading", state.StartTime)
+	}
 }
 
 func TestState_RecordIteration_WithFiles(t *testing.T) {
@@ -32,9 +34,6 @@ func TestState_RecordIteration_WithFiles(t *testing.T) {
 	if state.ConsecutiveNoChanges != 0 {
 		t.Errorf("ConsecutiveNoChanges = %d, want 0", state.ConsecutiveNoChanges)
 	}
-	if len(state.FilesChangedHistory) != 1 {
-		t.Errorf("FilesChangedHistory len = %d, want 1", len(state.FilesChangedHistory))
-	}
 	if len(state.TotalFilesChanged) != 2 {
 		t.Errorf("TotalFilesChanged len = %d, want 2", len(state.TotalFilesChanged))
 	}
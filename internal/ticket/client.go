@@ -2,6 +2,7 @@
 package ticket
 
 import (
+	"bytes"
 	"errors"
 	"fmt"
 	"os"
@@ -68,6 +69,8 @@ func NewClient(command string) *CLIClient {
 		}
 		dir = filepath.Join(home, ".tickets")
 	}
+	// Cleaned once here; findTicketFile relies on it for its prefix check.
+	dir = filepath.Clean(dir)
 	if command == "" {
 		command = "tk"
 	}
@@ -107,8 +110,7 @@ func (c *CLIClient) UpdatePhase(id string, phaseName string) error {
 		return fmt.Errorf("read ticket file: %w", err)
 	}
 
-	lines := strings.Split(string(content), "\n")
-	result := updatePhaseLines(lines, normalizePhase(phaseName))
+	updated, result := updatePhaseInCheckboxes(string(content), normalizePhase(phaseName))
 	if !result.found {
 		return fmt.Errorf("%w: %s", ErrPhaseNotFound, phaseName)
 	}
@@ -116,7 +118,7 @@ func (c *CLIClient) UpdatePhase(id string, phaseName string) error {
 		return nil
 	}
 
-	return writeFileAtomically(filePath, []byte(strings.Join(lines, "\n")))
+	return writeFileAtomically(filePath, []byte(updated))
 }
 
 type phaseUpdateResult struct {
@@ -124,30 +126,39 @@ type phaseUpdateResult struct {
 	alreadyDone bool
 }
 
-func updatePhaseLines(lines []string, normalizedPhase string) phaseUpdateResult {
-	return updatePhaseInCheckboxes(lines, normalizedPhase)
-}
+// updatePhaseInCheckboxes checks off the first checkbox matching
+// normalizedPhase. Only the matching line is rewritten; the rest of content
+// is spliced around it unchanged.
+func updatePhaseInCheckboxes(content, normalizedPhase string) (string, phaseUpdateResult) {
+	for start := 0; start <= len(content); {
+		end := strings.IndexByte(content[start:], '\n')
+		if end < 0 {
+			end = len(content)
+		} else {
+			end += start
+		}
+		line := content[start:end]
+		next := end + 1
 
-func updatePhaseInCheckboxes(lines []string, normalizedPhase string) phaseUpdateResult {
-	for i, line := range lines {
-		match := phaseRegex.FindStringSubmatch(line)
-		if match == nil {
+		name, checked, ok := parseCheckbox(line)
+		if !ok {
+			start = next
 			continue
 		}
 
-		existingPhase := normalizePhase(match[2])
+		existingPhase := normalizePhase(name)
 		if !phaseMatches(existingPhase, normalizedPhase) {
+			start = next
 			continue
 		}
 
-		if match[1] != " " {
-			return phaseUpdateResult{found: true, alreadyDone: true}
+		if checked {
+			return content, phaseUpdateResult{found: true, alreadyDone: true}
 		}
 
-		lines[i] = strings.Replace(line, "- [ ]", "- [x]", 1)
-		return phaseUpdateResult{found: true}
+		return content[:start] + strings.Replace(line, "- [ ]", "- [x]", 1) + content[end:], phaseUpdateResult{found: true}
 	}
-	return phaseUpdateResult{}
+	return content, phaseUpdateResult{}
 }
 
 func phaseMatches(existingPhase, normalizedPhase string) bool {
@@ -193,9 +204,8 @@ func writeFileAtomically(path string, data []byte) error {
 }
 
 func (c *CLIClient) findTicketFile(id string) (string, error) {
-	path := filepath.Clean(filepath.Join(c.ticketsDir, id+".md"))
-	dir := filepath.Clean(c.ticketsDir)
-	if !strings.HasPrefix(path, dir+string(filepath.Separator)) {
+	path := filepath.Join(c.ticketsDir, id+".md")
+	if !strings.HasPrefix(path, c.ticketsDir+string(filepath.Separator)) {
 		return "", fmt.Errorf("%w: %s", ErrTicketNotFound, id)
 	}
 	if _, err := os.Stat(path); err == nil {
@@ -229,9 +239,8 @@ func (c *CLIClient) AddNote(id string, note string) error {
 	if err := ValidateID(id); err != nil {
 		return err
 	}
-	out, err := exec.Command(c.command, "add-note", id, note).CombinedOutput()
-	if err != nil {
-		return fmt.Errorf("add note to ticket %s: %s: %w", id, strings.TrimSpace(string(out)), err)
+	if stderr, err := c.runQuiet("add-note", id, note); err != nil {
+		return fmt.Errorf("add note to ticket %s: %s: %w", id, stderr, err)
 	}
 	return nil
 }
@@ -246,13 +255,22 @@ func (c *CLIClient) SetStatus(id string, status string) error {
 	default:
 		return fmt.Errorf("invalid status: %s", status)
 	}
-	out, err := exec.Command(c.command, "set-status", id, status).CombinedOutput()
-	if err != nil {
-		return fmt.Errorf("set status for ticket %s: %s: %w", id, strings.TrimSpace(string(out)), err)
+	if stderr, err := c.runQuiet("set-status", id, status); err != nil {
+		return fmt.Errorf("set status for ticket %s: %s: %w", id, stderr, err)
 	}
 	return nil
 }
 
+// runQuiet runs a ticket command whose output is not needed. Stdout is
+// discarded; only stderr is captured, for the error message.
+func (c *CLIClient) runQuiet(args ...string) (string, error) {
+	var stderr bytes.Buffer
+	cmd := exec.Command(c.command, args...)
+	cmd.Stderr = &stderr
+	err := cmd.Run()
+	return strings.TrimSpace(stderr.String()), err
+}
+
 func parseTicket(id string, content string) (*Ticket, error) {
 	ticket := &Ticket{
 		ID:         id,
@@ -281,35 +299,55 @@ func parseTicket(id string, content string) (*Ticket, error) {
 		}
 	}
 
-	// If no title in frontmatter, extract from first # heading
+	// Heading and phases come from one pass; the heading is only used
+	// when the frontmatter has no title.
+	heading, phases := scanTicketBody(content)
 	if ticket.Title == "" {
-		if matches := titleRegex.FindStringSubmatch(content); len(matches) > 1 {
-			ticket.Title = strings.TrimSpace(matches[1])
-		}
+		ticket.Title = heading
 	}
-
-	// Parse phases from checkboxes
-	ticket.Phases = parsePhases(content)
+	ticket.Phases = phases
 
 	return ticket, nil
 }
 
-var phaseRegex = regexp.MustCompile(`- \[([ xX])\] (.+)`)
-var titleRegex = regexp.MustCompile(`(?m)^# (.+)$`)
-
-func parsePhases(content string) []domain.Phase {
-	matches := phaseRegex.FindAllStringSubmatch(content, -1)
-	if len(matches) == 0 {
-		return nil
-	}
-	phases := make([]domain.Phase, 0, len(matches))
-	for _, match := range matches {
+// scanTicketBody walks content once, returning the text of the first
+// "# " heading and the phases from its checkbox lines.
+func scanTicketBody(content string) (title string, phases []domain.Phase) {
+	haveTitle := false
+	for line := range strings.SplitSeq(content, "\n") {
+		if !haveTitle && len(line) > len("# ") && strings.HasPrefix(line, "# ") {
+			title = strings.TrimSpace(line[len("# "):])
+			haveTitle = true
+		}
+		name, checked, ok := parseCheckbox(line)
+		if !ok {
+			continue
+		}
 		phases = append(phases, domain.Phase{
-			Name:      strings.TrimSpace(match[2]),
-			Completed: match[1] != " ",
+			Name:      strings.TrimSpace(name),
+			Completed: checked,
 		})
 	}
-	return phases
+	return title, phases
+}
+
+// parseCheckbox finds the first "- [ ] name" or "- [x] name" checkbox in
+// line (the marker may appear anywhere in the line, and the name must be
+// non-empty). It returns the untrimmed name and whether the box is checked.
+func parseCheckbox(line string) (name string, checked bool, ok bool) {
+	for i := strings.Index(line, "- ["); i >= 0; {
+		rest := line[i+len("- ["):]
+		if len(rest) > len("x] ") && (rest[0] == ' ' || rest[0] == 'x' || rest[0] == 'X') &&
+			rest[1] == ']' && rest[2] == ' ' {
+			return rest[3:], rest[0] != ' ', true
+		}
+		next := strings.Index(line[i+1:], "- [")
+		if next < 0 {
+			break
+		}
+		i += 1 + next
+	}
+	return "", false, false
 }
 
 // ToWorkItem converts a Ticket to a domain.WorkItem.
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"regexp"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -81,7 +82,7 @@ func TestParsePhases(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			phases := parsePhases(tt.content)
+			_, phases := scanTicketBody(tt.content)
 			if len(phases) != len(tt.expected) {
 				t.Fatalf("expected %d phases, got %d", len(tt.expected), len(phases))
 			}
@@ -97,6 +98,38 @@ func TestParsePhases(t *testing.T) {
 	}
 }
 
+func TestParseCheckboxMatchesRegex(t *testing.T) {
+	checkboxRegex := regexp.MustCompile(`- \[([ xX])\] (.+)`)
+	lines := []string{
+		"- [ ] Phase 1",
+		"- [x] Phase 2",
+		"- [X] Phase 3",
+		"  - [ ] indented",
+		"* [ ] not a dash",
+		"text - [x] inline marker",
+		"- [-] Phase 4 then - [ ] real one",
+		"- [ ] ",
+		"- [ ]  ",
+		"- [ ]",
+		"- [x]Phase",
+		"- - [ ] nested dash",
+		"- [ ] name\r",
+		"",
+	}
+
+	for _, line := range lines {
+		t.Run(line, func(t *testing.T) {
+			name, checked, ok := parseCheckbox(line)
+			match := checkboxRegex.FindStringSubmatch(line)
+			require.Equal(t, match != nil, ok)
+			if match != nil {
+				require.Equal(t, match[2], name)
+				require.Equal(t, match[1] != " ", checked)
+			}
+		})
+	}
+}
+
 func TestParseTicket(t *testing.T) {
 	tests := []struct {
 		name           string
@@ -146,6 +179,14 @@ title: "Simple task"
 			expectedStatus: "",
 			expectedPhases: 1,
 		},
+		{
+			name:           "first top-level heading is the title",
+			id:             "t-456",
+			content:        "## Overview\r\n# Real Title\r\n# Later Heading\r\n- [ ] Step\r\n",
+			expectedTitle:  "Real Title",
+			expectedStatus: "",
+			expectedPhases: 1,
+		},
 	}
 
 	for _, tt := range tests {
@@ -411,6 +452,16 @@ func TestUpdatePhase(t *testing.T) {
 		require.NoError(t, err)
 		assert.Contains(t, string(data), "- [x] "+phaseInTicket)
 	})
+
+	t.Run("rewrites only the matched line", func(t *testing.T) {
+		client, path := setup(t, "## Design\r\n- [ ] Phase 1: Setup\n\n- [ ] Phase 2: Implement")
+		err := client.UpdatePhase("t-1234", "Phase 2: Implement")
+		require.NoError(t, err)
+
+		data, err := os.ReadFile(path)
+		require.NoError(t, err)
+		assert.Equal(t, "## Design\r\n- [ ] Phase 1: Setup\n\n- [x] Phase 2: Implement", string(data))
+	})
 }
 
 func TestUpdatePhase_OverlappingNames(t *testing.T) {
@@ -521,6 +572,22 @@ func TestSetStatus_InvalidStatus(t *testing.T) {
 	require.Contains(t, err.Error(), "invalid status")
 }
 
+func TestQuietCommands_ReportStderrOnly(t *testing.T) {
+	script := filepath.Join(t.TempDir(), "tk")
+	require.NoError(t, os.WriteFile(script, []byte("#!/bin/sh\necho stdout-noise\necho \"$1 failed\" >&2\nexit 1\n"), 0o755))
+	client := &CLIClient{ticketsDir: t.TempDir(), command: script}
+
+	err := client.AddNote("t-123", "note")
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "add-note failed")
+	assert.NotContains(t, err.Error(), "stdout-noise")
+
+	err = client.SetStatus("t-123", protocol.WorkItemClosed)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "set-status failed")
+	assert.NotContains(t, err.Error(), "stdout-noise")
+}
+
 func TestNewClient_EnvHandling(t *testing.T) {
 	t.Run("reads TICKETS_DIR env", func(t *testing.T) {
 		original := os.Getenv("TICKETS_DIR")
@@ -529,6 +596,9 @@ func TestNewClient_EnvHandling(t *testing.T) {
 		os.Setenv("TICKETS_DIR", "/custom/tickets")
 		client := NewClient("")
 		assert.Equal(t, "/custom/tickets", client.ticketsDir)
+
+		os.Setenv("TICKETS_DIR", "/custom/tickets/")
+		assert.Equal(t, "/custom/tickets", NewClient("").ticketsDir)
 	})
 
 	t.Run("falls back to ~/.tickets", func(t *testing.T) {